@@ -1,6 +1,12 @@
 # animations/scenes/beam_bending_formulation.py
 from manim import *
 import numpy as np
+import os
+import sys
+
+# Manim loads scene files by path, so make the project root importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from animations.utils.lod import lod_samples
 
 class BeamSecondArea(ThreeDScene):
     def construct(self):
@@ -24,7 +30,8 @@ class BeamSecondArea(ThreeDScene):
         # Create a circular cylinder (beam)
         radius = 0.5
         height = 6
-        circular_beam = Cylinder(radius=radius, height=height, direction=np.array([1.0, 0., 0.]),resolution=(20, 20))
+        cylinder_resolution = lod_samples("cylinder_resolution")
+        circular_beam = Cylinder(radius=radius, height=height, direction=np.array([1.0, 0., 0.]),resolution=(cylinder_resolution, cylinder_resolution))
         circular_beam.set_fill(BLUE, opacity=0.4)
         
         # Neutral axis (centered along x-axis)
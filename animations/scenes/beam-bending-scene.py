@@ -2,38 +2,21 @@
 from manim import *
 import numpy as np
 import math
-
-# Precise NACA 0012 coordinates (x, y) where x is along chord, y is thickness
-# These are normalized coordinates (0-1 for x, calculated based on NACA formula for y)
-# Format: (x, y) points from trailing edge (1,0), around to leading edge (0,0), and back to trailing edge (1,0)
-naca_coordinates = [
-    # Upper surface from TE to LE
-    (1.0000, 0.0000), (0.9750, 0.0044), (0.9500, 0.0089), (0.9250, 0.0124), (0.9000, 0.0158),
-    (0.8750, 0.0187), (0.8500, 0.0213), (0.8000, 0.0266), (0.7688, 0.0297), (0.7375, 0.0326),
-    (0.7063, 0.0352), (0.6750, 0.0376), (0.6438, 0.0398), (0.6125, 0.0417), (0.5813, 0.0435),
-    (0.5500, 0.0451), (0.5188, 0.0464), (0.4875, 0.0476), (0.4563, 0.0486), (0.4250, 0.0494),
-    (0.3938, 0.0501), (0.3625, 0.0505), (0.3313, 0.0507), (0.3000, 0.0507), (0.2875, 0.0506),
-    (0.2750, 0.0503), (0.2625, 0.0500), (0.2500, 0.0495), (0.2375, 0.0490), (0.2250, 0.0484),
-    (0.2125, 0.0479), (0.2000, 0.0473), (0.1875, 0.0466), (0.1750, 0.0458), (0.1625, 0.0449),
-    (0.1500, 0.0439), (0.1375, 0.0428), (0.1250, 0.0416), (0.1125, 0.0403), (0.1000, 0.0388),
-    (0.0875, 0.0371), (0.0750, 0.0348), (0.0625, 0.0323), (0.0500, 0.0294), (0.0438, 0.0277),
-    (0.0375, 0.0258), (0.0313, 0.0238), (0.0250, 0.0216), (0.0219, 0.0201), (0.0188, 0.0186),
-    (0.0156, 0.0169), (0.0125, 0.0151), (0.0094, 0.0131), (0.0063, 0.0107), (0.0031, 0.0075),
-    (0.0016, 0.0053), (0.0001, 0.0013), (0.0000, 0.0000),
-    # Lower surface from LE to TE
-    (0.0001, -0.0013), (0.0016, -0.0053), (0.0031, -0.0075), (0.0063, -0.0107), (0.0094, -0.0131),
-    (0.0125, -0.0151), (0.0156, -0.0169), (0.0188, -0.0186), (0.0219, -0.0201), (0.0250, -0.0216),
-    (0.0313, -0.0238), (0.0375, -0.0258), (0.0438, -0.0277), (0.0500, -0.0294), (0.0625, -0.0323),
-    (0.0750, -0.0348), (0.0875, -0.0371), (0.1000, -0.0388), (0.1125, -0.0403), (0.1250, -0.0416),
-    (0.1375, -0.0428), (0.1500, -0.0439), (0.1625, -0.0449), (0.1750, -0.0458), (0.1875, -0.0466),
-    (0.2000, -0.0473), (0.2125, -0.0479), (0.2250, -0.0484), (0.2375, -0.0490), (0.2500, -0.0495),
-    (0.2625, -0.0500), (0.2750, -0.0503), (0.2875, -0.0506), (0.3000, -0.0507), (0.3313, -0.0507),
-    (0.3625, -0.0505), (0.3938, -0.0501), (0.4250, -0.0494), (0.4563, -0.0486), (0.4875, -0.0476),
-    (0.5188, -0.0464), (0.5500, -0.0451), (0.5813, -0.0435), (0.6125, -0.0417), (0.6438, -0.0398),
-    (0.6750, -0.0376), (0.7063, -0.0352), (0.7375, -0.0326), (0.7688, -0.0297), (0.8000, -0.0266),
-    (0.8500, -0.0213), (0.8750, -0.0187), (0.9000, -0.0158), (0.9250, -0.0124), (0.9500, -0.0089),
-    (0.9750, -0.0044), (1.0000, 0.0000),
-]
+import os
+import sys
+
+# Manim loads scene files by path, so make the project root importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from animations.utils.airfoil import naca_surfaces
+from animations.utils.cutout_layout import layout_cutouts
+from animations.utils.fuel_tank import FuelSurface
+from animations.utils.geometry_cache import cached_geometry
+from animations.utils.lod import lod_samples
+from animations.utils.naca import naca_airfoil
+from animations.utils.section_properties import circle_outline, ellipse_outline, section_properties
+from animations.utils.spanwise import cantilever_tip_deflection, sample_span
+from animations.utils.wing_deformation import WingBending, cantilever_deflection
+from animations.utils.wing_mesh import build_wing_mesh, build_wing_sections, section_vertices
 
 def create_beam(self):
     """Create a straight beam."""
@@ -112,72 +95,21 @@ def create_wing_from_preset_coordinates(self):
     # Convert sweep angle to tangent for easier calculation
     sweep_tan = math.tan(math.radians(sweep_angle_deg))
     
-    # Create the wing surface by extruding the airfoil along the span
-    wing_surfaces = []
+    # NACA 0012 outline from trailing edge, around the leading edge and back
+    naca_coordinates = naca_airfoil("0012").outline
     
     # Number of segments along the span
-    num_span_segments = 30
-    
-    # Create a series of quadrilaterals to form the wing surface
-    for i in range(num_span_segments):
-        # Span position parameters (normalized from 0 to 1)
-        span_pos1 = i / num_span_segments
-        span_pos2 = (i + 1) / num_span_segments
-        
-        # Calculate actual span positions
-        x1 = wing_length * span_pos1
-        x2 = wing_length * span_pos2
-        
-        # Calculate chord lengths at these span positions (linear taper)
-        chord1 = root_chord_length * (1 - span_pos1) + tip_chord_length * span_pos1
-        chord2 = root_chord_length * (1 - span_pos2) + tip_chord_length * span_pos2
-        
-        # Calculate sweep offsets at these span positions
-        sweep_offset1 = x1 * sweep_tan
-        sweep_offset2 = x2 * sweep_tan
-        
-        for j in range(len(naca_coordinates) - 1):
-            # Get two consecutive airfoil coordinates
-            chord_pos1, thickness1 = naca_coordinates[j]
-            chord_pos2, thickness2 = naca_coordinates[j + 1]
-            
-            # Convert to actual positions in 3D space
-            # x is span, y is chord (with sweep), z is thickness
-            # Scale the y and z coordinates by the local chord length
-            p1 = [
-                x1, 
-                (chord_pos1 - 0.5) * chord1 + sweep_offset1, 
-                thickness1 * chord1
-            ]
-            p2 = [
-                x1, 
-                (chord_pos2 - 0.5) * chord1 + sweep_offset1, 
-                thickness2 * chord1
-            ]
-            p3 = [
-                x2, 
-                (chord_pos2 - 0.5) * chord2 + sweep_offset2, 
-                thickness2 * chord2
-            ]
-            p4 = [
-                x2, 
-                (chord_pos1 - 0.5) * chord2 + sweep_offset2, 
-                thickness1 * chord2
-            ]
-            
-            # Create a quadrilateral for this segment
-            quad = Polygon(
-                p1, p2, p3, p4,
-                fill_color=BLUE_E,
-                fill_opacity=0.8,
-                stroke_color=WHITE,
-                stroke_width=0.5,
-                stroke_opacity=0.3
-            )
-            wing_surfaces.append(quad)
+    num_span_segments = lod_samples("wing_span_segments")
     
-    # Combine all surfaces into a single VGroup
-    wing = VGroup(*wing_surfaces)
+    # Extrude the airfoil along the span as a batched quad mesh
+    wing = build_wing_mesh(
+        naca_coordinates,
+        wing_length,
+        root_chord_length,
+        tip_chord_length,
+        sweep_tan,
+        num_span_segments
+    )
     
     # Store wing parameters for later use
     self.wing_params = {
@@ -187,59 +119,20 @@ def create_wing_from_preset_coordinates(self):
         "sweep_angle_deg": sweep_angle_deg,
         "sweep_reference": sweep_reference,
         "sweep_tan": sweep_tan,
+        "num_span_segments": num_span_segments,
         "naca_coordinates": naca_coordinates
     }
     
     return wing
 
-def create_airfoil_section(x_pos, local_chord, sweep_offset, sweep_reference, naca_coordinates):
-        """Create a NACA 0012 airfoil section at position x_pos with appropriate chord length and sweep."""
-        # Convert coordinates to points in 3D space
-        points = []
-        for chord_pos, thickness in naca_coordinates:
-            
-            # Scale coordinates by local chord length and apply sweep
-            point = [
-                x_pos,  # x - span position
-                (chord_pos - 0.5) * local_chord + sweep_offset,  # y - chord position with sweep
-                thickness * local_chord  # z - thickness scaled by local chord
-            ]
-            points.append(point)
-        
-        # Create polygon from points
-        section = Polygon(
-            *points,
-            fill_color=YELLOW,
-            fill_opacity=0.6,
-            stroke_color=YELLOW_E,
-            stroke_width=2
-        )
-        
-        return section
-
 def show_cross_sections(self, wing, positions):
     """Show cross-sections along the wing."""
     # Positions for cross-sections - distribute evenly along span
     
-    sections = []
+    # Create every section at once, with the taper and sweep of its span position
+    sections = build_wing_sections_at(self.wing_params, positions)
     
-    # Get wing parameters
-    wing_params = self.wing_params
-    
-    for i, x_pos in enumerate(positions):
-        # Calculate span position (normalized from 0 to 1)
-        span_pos = x_pos / wing_params["length"]
-        
-        # Calculate chord length at this span position (linear taper)
-        local_chord = wing_params["root_chord"] * (1 - span_pos) + wing_params["tip_chord"] * span_pos
-        
-        # Calculate sweep offset at this span position
-        sweep_offset = x_pos * wing_params["sweep_tan"]
-        
-        # Create a section
-        section = create_airfoil_section(x_pos, local_chord, sweep_offset, wing_params["sweep_reference"], wing_params["naca_coordinates"])
-        sections.append(section)
-        
+    for section in sections:
         # Animate
         self.play(
             Create(section),
@@ -248,18 +141,84 @@ def show_cross_sections(self, wing, positions):
     
     return sections
 
+def build_wing_sections_at(wing_params, positions):
+    """Build the airfoil sections of the wing at span positions as one VGroup."""
+    return build_wing_sections(
+        wing_params["naca_coordinates"],
+        wing_params["length"],
+        wing_params["root_chord"],
+        wing_params["tip_chord"],
+        wing_params["sweep_tan"],
+        positions
+    )
+
+def get_wing_section_properties(wing_params, positions):
+    """
+    Return the area, centroid and second moments of the solid wing section
+    at every span position, computed from the airfoil outline in one
+    batched call. Sections lie in the (y, z) plane, so iyy is the second
+    moment for bending of the wing.
+    """
+    outlines = section_vertices(
+        wing_params["naca_coordinates"],
+        wing_params["length"],
+        wing_params["root_chord"],
+        wing_params["tip_chord"],
+        wing_params["sweep_tan"],
+        positions
+    )
+    return section_properties(outlines[..., 1:])
+
+def wing_properties_at(wing_params):
+    """Return a function giving the section properties of the wing at an array of span positions."""
+    return lambda positions: get_wing_section_properties(wing_params, positions)
+
+def get_spanwise_second_moment(wing_params, num_stations=None):
+    """
+    Return the span stations and the section properties at every one of
+    them, for hundreds or thousands of stations in one batched call.
+    """
+    return sample_span(wing_properties_at(wing_params), wing_params["length"], num_stations)
+
+def get_tip_deflection_ratio(wing_params):
+    """
+    Return the tip deflection of the wing under a uniform load, relative
+    to a wing of the same span that keeps the root section everywhere
+    (q L^4 / (8 E I_root)).
+    """
+    properties_at = wing_properties_at(wing_params)
+    length = wing_params["length"]
+    root_iyy = properties_at(np.array([0.0])).iyy[0]
+    return cantilever_tip_deflection(properties_at, length).value / (length**4 / (8 * root_iyy))
+
+def format_power_of_ten(value, digits=2):
+    """Format a positive number as LaTeX in scientific notation, e.g. 4.27 \\times 10^{-5}."""
+    exponent = int(np.floor(np.log10(value)))
+    return rf"{value / 10**exponent:.{digits}f} \times 10^{{{exponent}}}"
+
+def get_section_values_label(properties, chord):
+    """
+    Return the area and second moment of a drawn section as MathTex, in
+    units of its chord so sections drawn at different sizes compare.
+    """
+    area = properties.area[0] / chord**2
+    iyy = properties.iyy[0] / chord**4
+    return MathTex(
+        rf"A = {area:.3f}\,c^2,", rf"\quad I = {format_power_of_ten(iyy)}\,c^4",
+        font_size=28
+    )
+
 # Function for cantilever beam deflection curve
+@cached_geometry
 def get_cantilever_curve(y_offset=0, max_deflection=1.2, beam_length=9, beam_center_y=0, beam_left=-5):
-    points = []
-    num_points = 100
-    for i in range(num_points + 1):
-        x_ratio = i / num_points
-        x = beam_left + x_ratio * beam_length
-        
-        # Cubic deflection curve for cantilever
-        deflection = max_deflection * (3 * x_ratio**2 - 2 * x_ratio**3)
-        y = beam_center_y + y_offset - deflection
-        points.append([x, y, 0])
+    num_points = lod_samples("curve_points")
+    x_ratio = np.linspace(0, 1, num_points + 1)
+    
+    # Cubic deflection curve for cantilever
+    deflection = max_deflection * (3 * x_ratio**2 - 2 * x_ratio**3)
+    points = np.zeros((num_points + 1, 3))
+    points[:, 0] = beam_left + x_ratio * beam_length
+    points[:, 1] = beam_center_y + y_offset - deflection
     return points
 
 class BeamEquationsScene(Scene):
@@ -603,7 +562,7 @@ class BeamEquationsScene(Scene):
         # Function to create deformed angled beam points
         def get_angled_curve_points(start_x, start_y, angle_rad, length, max_deflection=0.8):
             points = []
-            num_points = 100
+            num_points = lod_samples("curve_points")
             
             # Direction vector from the angle
             dir_x = math.cos(angle_rad)
@@ -748,8 +707,9 @@ class BeamSecondAreaWingScene(ThreeDScene):
         wing = create_wing_from_preset_coordinates(self)
         self.animate_wing_creation(wing)
         
-        # Step 4: Rotate to tri-iso view and show cross sections
+        # Step 4: Rotate to tri-iso view, bend the wing under load and show cross sections
         self.rotate_to_triso_view(wing)
+        self.bend_wing(wing)
         positions = [0.5, 2.0, 3.5]  # Positions along span (root, middle, tip)
         sections = show_cross_sections(self,wing,positions)
         
@@ -770,6 +730,9 @@ class BeamSecondAreaWingScene(ThreeDScene):
             FadeOut(self.tip_label),
             FadeOut(self.x_label)
         )
+        
+        # Step 7: Sweep the second moment of area along the whole span
+        self.plot_spanwise_second_moment()
     
     def highlight_second_moment(self):
         """Highlight the I(x) term and label it as the Second Moment of Area."""
@@ -840,6 +803,20 @@ class BeamSecondAreaWingScene(ThreeDScene):
         )
         self.wait(1)
     
+    def bend_wing(self, wing):
+        """Bend the wing up under a distributed lift load and let it spring back."""
+        bending = WingBending(wing, cantilever_deflection(self.wing_params["length"], 0.6))
+        load = ValueTracker(0)
+        wing.add_updater(lambda mob: bending.apply(load.get_value()))
+
+        self.play(load.animate.set_value(1), run_time=2)
+        self.wait(0.5)
+        self.play(load.animate.set_value(0), run_time=1.5)
+
+        wing.clear_updaters()
+        bending.restore()
+        self.wait(0.5)
+    
     def rearrange_elements(self, wing, sections):
         """Move wing to right side, and sections to left side."""
         # Move wing to right side and shrink
@@ -974,6 +951,71 @@ class BeamSecondAreaWingScene(ThreeDScene):
         # Return the group in case you need to reference it later
         return equation_group
     
+    def plot_spanwise_second_moment(self):
+        """Plot I(x) along the span, sweeping a marker from root to tip."""
+        length = self.wing_params["length"]
+        x, properties = get_spanwise_second_moment(self.wing_params)
+        ratio = properties.iyy / properties.iyy[0]
+        
+        # Axes in the frame, since the camera is still in the tri-iso view
+        axes = Axes(
+            x_range=[0, length, 1],
+            y_range=[0, 1.1, 0.25],
+            x_length=8,
+            y_length=4,
+            axis_config={"include_numbers": True, "font_size": 24},
+            tips=False
+        )
+        axes.move_to(np.array([0, -0.5, 0]))
+        axis_labels = axes.get_axis_labels(
+            MathTex("x", font_size=32),
+            MathTex(r"I(x) / I_{root}", font_size=32)
+        )
+        title = Tex("Second Moment of Area Along the Span", font_size=40)
+        title.to_edge(UP)
+        self.add_fixed_in_frame_mobjects(axes, axis_labels, title)
+        self.play(Write(title), Create(axes), Write(axis_labels))
+        
+        # Bezier points of the whole curve; the sweep shows the first ones
+        curve_points = VMobject().set_points_as_corners(axes.coords_to_point(x, ratio).T).points
+        curve = VMobject(color=YELLOW, stroke_width=3)
+        curve.set_points(curve_points[:4])
+        marker = Dot(color=YELLOW)
+        self.add_fixed_in_frame_mobjects(curve, marker)
+        
+        span = ValueTracker(0)
+        
+        def sweep_curve(mob):
+            # Whole segments up to the swept position, as a view of the points
+            segments = max(1, int(np.searchsorted(x, span.get_value())))
+            mob.points = curve_points[:4 * min(segments, len(x) - 1)]
+        
+        def follow_curve(mob):
+            mob.move_to(axes.coords_to_point(span.get_value(), np.interp(span.get_value(), x, ratio)))
+        
+        curve.add_updater(sweep_curve)
+        marker.add_updater(follow_curve)
+        self.play(span.animate.set_value(length), run_time=4, rate_func=linear)
+        curve.clear_updaters()
+        marker.clear_updaters()
+        
+        # Tip deflection under a uniform load, against a wing that keeps the root section
+        deflection = get_tip_deflection_ratio(self.wing_params)
+        note = Tex(f"Tip deflection: {deflection:.1f}$\\times$ a wing with the root $I$ everywhere", font_size=32)
+        note.next_to(axes, DOWN, buff=0.4)
+        self.add_fixed_in_frame_mobjects(note)
+        self.play(Write(note))
+        self.wait(3)
+        
+        self.play(
+            FadeOut(title),
+            FadeOut(axes),
+            FadeOut(axis_labels),
+            FadeOut(curve),
+            FadeOut(marker),
+            FadeOut(note)
+        )
+    
 class BeamModulousElasticityScene(ThreeDScene):
     def construct(self):
         # Step 1: Start with Euler-Bernoulli equation
@@ -1000,7 +1042,13 @@ class BeamModulousElasticityScene(ThreeDScene):
             run_time = 5)
         cross_section_label.next_to(cross_section, UP, buff=0.5)
         self.add_fixed_in_frame_mobjects(cross_section_label)
-        self.play(Write(cross_section_label))
+        # Area and second moment of the section as drawn
+        cross_section_values = get_section_values_label(self.root_section_properties, self.root_section_chord)
+        cross_section_values.next_to(cross_section, DOWN, buff=0.2)
+        self.add_fixed_in_frame_mobjects(cross_section_values)
+        # Let the fuel slosh in the tank while the section is on screen
+        cross_section.add_updater(self.fuel_surface.update)
+        self.play(Write(cross_section_label), Write(cross_section_values))
         self.wait(3.5)
         # Step 5: Show the airfoil cross-section
         tip_section = self.create_tip_cross_section(scale_factor=1.0, num_cutouts=8)
@@ -1011,14 +1059,20 @@ class BeamModulousElasticityScene(ThreeDScene):
             run_time = 5)
         tip_section_label.next_to(tip_section, UP, buff=0.5)
         self.add_fixed_in_frame_mobjects(tip_section_label)
-        self.play(Write(tip_section_label))
+        tip_section_values = get_section_values_label(self.tip_section_properties, self.tip_section_chord)
+        tip_section_values.next_to(tip_section, DOWN, buff=0.2)
+        self.add_fixed_in_frame_mobjects(tip_section_values)
+        self.play(Write(tip_section_label), Write(tip_section_values))
         self.wait(3.5)
 
+        cross_section.clear_updaters()
         self.play(
             FadeOut(cross_section),
             FadeOut(cross_section_label),
+            FadeOut(cross_section_values),
             FadeOut(tip_section),
             FadeOut(tip_section_label),
+            FadeOut(tip_section_values),
             FadeOut(wing),
             FadeOut(self.wing_title),
             FadeOut(sections[0],sections[1])
@@ -1170,32 +1224,19 @@ class BeamModulousElasticityScene(ThreeDScene):
         scale_factor = 8.0
         
         # Separate upper and lower airfoil points
-        upper_points = []
-        lower_points = []
-        leading_edge_index = None
-        
-        # First pass: identify the leading edge (point with x=0.0, y=0.0)
-        for i, (chord_pos, thickness) in enumerate(naca_coordinates):
-            if chord_pos == 0.0 and thickness == 0.0:
-                leading_edge_index = i
-                break
-        
-        if leading_edge_index is None:
-            # Fallback if exact 0,0 not found
-            leading_edge_index = len(naca_coordinates) // 2
-        
-        # Second pass: separate points
-        for i, (chord_pos, thickness) in enumerate(naca_coordinates):
+        airfoil = naca_airfoil("0012")
+        
+        def scale_points(surface):
             # Scale coordinates
-            x = (chord_pos - 0.5) * scale_factor
-            y = thickness * scale_factor
-            
-            if i <= leading_edge_index:
-                # Points from trailing edge to leading edge (upper surface)
-                upper_points.append(np.array([x, y, 0]))
-            else:
-                # Points from leading edge to trailing edge (lower surface)
-                lower_points.append(np.array([x, y, 0]))
+            points = np.zeros((len(surface), 3))
+            points[:, 0] = (surface[:, 0] - 0.5) * scale_factor
+            points[:, 1] = surface[:, 1] * scale_factor
+            return points
+        
+        # Points from trailing edge to leading edge (upper surface)
+        upper_points = list(scale_points(airfoil.upper[::-1]))
+        # Points from leading edge to trailing edge (lower surface), leading edge excluded
+        lower_points = list(scale_points(airfoil.lower[1:]))
         
         # Complete airfoil outline (all points in order)
         airfoil_points = []
@@ -1232,32 +1273,12 @@ class BeamModulousElasticityScene(ThreeDScene):
         rear_pos = fuel_tank_width/2  # Right edge of the tank (tangent position)
         rear_inner_pos = rear_pos + scale_factor * 0.01  # Second vertical line position
         
-        # Function to find y value on airfoil at a specific x position
-        def get_y_on_airfoil(x, points):
-            # Find the two points that x falls between and interpolate
-            for i in range(len(points) - 1):
-                x1, y1 = points[i][0], points[i][1]  # First point
-                x2, y2 = points[i+1][0], points[i+1][1]  # Next point
-                
-                # If x is between these two points
-                if (x1 <= x <= x2) or (x2 <= x <= x1):
-                    # Linear interpolation
-                    if x2 == x1:  # Avoid division by zero
-                        return y1
-                    t = (x - x1) / (x2 - x1)
-                    y = y1 + t * (y2 - y1)
-                    return y
-            
-            # If not found, return the y of the closest point
-            return points[0][1]  # Default fallback
-        
-        # Create front structural support (filled polygon)
-        # Find where the vertical lines intersect the airfoil surface
-        front_top_y = get_y_on_airfoil(front_pos, upper_points)
-        front_inner_top_y = get_y_on_airfoil(front_inner_pos, upper_points)
-        
-        front_bottom_y = get_y_on_airfoil(front_pos, lower_points)
-        front_inner_bottom_y = get_y_on_airfoil(front_inner_pos, lower_points)
+        # Find where the vertical lines intersect the airfoil surface, all in one lookup
+        support_x = np.array([front_pos, front_inner_pos, rear_pos, rear_inner_pos])
+        surfaces = naca_surfaces("0012")
+        chord_x = support_x / scale_factor + 0.5
+        front_top_y, front_inner_top_y, rear_top_y, rear_inner_top_y = surfaces.y_upper(chord_x) * scale_factor
+        front_bottom_y, front_inner_bottom_y, rear_bottom_y, rear_inner_bottom_y = surfaces.y_lower(chord_x) * scale_factor
         
         # Create polygon for front support
         front_support = Polygon(
@@ -1286,13 +1307,6 @@ class BeamModulousElasticityScene(ThreeDScene):
             stroke_width=1.5
         )
         
-        # Create rear structural support (filled polygon)
-        rear_top_y = get_y_on_airfoil(rear_pos, upper_points)
-        rear_inner_top_y = get_y_on_airfoil(rear_inner_pos, upper_points)
-        
-        rear_bottom_y = get_y_on_airfoil(rear_pos, lower_points)
-        rear_inner_bottom_y = get_y_on_airfoil(rear_inner_pos, lower_points)
-        
         # Create polygon for rear support
         rear_support = Polygon(
             np.array([rear_pos, rear_top_y, 0]),
@@ -1324,72 +1338,16 @@ class BeamModulousElasticityScene(ThreeDScene):
         cross_section.add(front_support, front_line1, front_line2)
         cross_section.add(rear_support, rear_line1, rear_line2)
         
-        # Create the wave pattern for the top of the fluid
-        num_waves = 22
-        wave_amplitude = fuel_tank_height * 0.08  # Reduced amplitude
-        
-        # Create a wave that's fully inscribed within the ellipse
-        wave_points = []
-        bottom_points = []
-        
-        # Calculate ellipse points to ensure waves stay inside the tank
-        for i in range(100):  # More points for smoother wave
-            # Parametric t from -π/2 to π/2 (left to right of ellipse)
-            t_range = np.linspace(-np.pi/2, np.pi/2, 100)
-            t = t_range[i]
-            
-            # Calculate x coordinate along the ellipse
-            x = (fuel_tank_width/2) * np.sin(t)
-            
-            # Calculate upper boundary of ellipse at this x
-            y_ellipse = (fuel_tank_height/2) * np.cos(t)
-            
-            # Calculate wave height - FIXED to stay inside ellipse
-            # Use a smaller percentage of the ellipse height for the wave
-            base_y = y_ellipse * 0.6  # Base wave position (60% of ellipse height)
-            max_wave_height = y_ellipse * 0.9  # Maximum wave height (90% of ellipse height)
-            
-            phase = num_waves * np.pi * (t + np.pi/2) / np.pi
-            # Ensure wave never exceeds ellipse boundary
-            wave_y = min(max_wave_height, base_y + wave_amplitude * np.sin(phase))
-            
-            # For bottom, we'll use the ellipse shape
-            bottom_y = -y_ellipse
-            
-            wave_points.append(np.array([x, wave_y, 0]))
-            bottom_points.append(np.array([x, bottom_y, 0]))
-        
-        # Create the wave curve
-        wave_curve = VMobject(
-            color=WHITE,
-            stroke_width=1.5
-        )
-        wave_curve.set_points_as_corners(wave_points)
+        # Create the fuel, its wave fully inscribed within the ellipse, and the tank bottom
+        self.fuel_surface = FuelSurface(fuel_tank_width, fuel_tank_height)
+        cross_section.add(self.fuel_surface.group)
         
-        # Create the bottom curve (follows ellipse shape)
-        bottom_curve = VMobject(
-            color=WHITE,
-            stroke_width=1.5
-        )
-        bottom_curve.set_points_as_corners(bottom_points)
-        
-        # Create a polygon for the blue fill area (combine wave and bottom curves)
-        fill_points = []
-        fill_points.extend(wave_points)
-        fill_points.extend(bottom_points[::-1])  # Reverse the bottom points for correct polygon
-        
-        fluid_area = Polygon(
-            *fill_points,
-            color=BLUE,
-            stroke_width=0,  # No stroke for the fill area
-            fill_color=BLUE,
-            fill_opacity=0.7
-        )
-        
-        # Add the filled area first, then the wave curve on top
-        cross_section.add(fluid_area)
-        cross_section.add(wave_curve)
-        cross_section.add(bottom_curve)
+        # Properties of the section as drawn: the airfoil with the fuel tank cut out
+        self.root_section_properties = section_properties([(
+            np.array(airfoil_points)[:, :2],
+            [ellipse_outline((0, 0), fuel_tank_width, fuel_tank_height)]
+        )])
+        self.root_section_chord = scale_factor
         
         return cross_section
     
@@ -1413,6 +1371,7 @@ class BeamModulousElasticityScene(ThreeDScene):
         
         # Convert normalized coordinates to actual coordinates
         # Center the airfoil at (0,0) with chord along x-axis
+        naca_coordinates = naca_airfoil("0012").outline
         scaled_points = []
         for x, y in naca_coordinates:
             scaled_x = (x - 0.5) * chord_length  # Center at origin
@@ -1429,78 +1388,17 @@ class BeamModulousElasticityScene(ThreeDScene):
         )
         tip_cross_section.add(airfoil)
         
-        # Calculate airfoil thickness at different chord positions
-        def get_airfoil_thickness(x_normalized):
-            """Get the total height (thickness) of the airfoil at a given normalized position"""
-            upper_y = 0
-            lower_y = 0
-            
-            # Find upper and lower y values at this x position
-            for j in range(len(naca_coordinates) - 1):
-                x1, y1 = naca_coordinates[j]
-                x2, y2 = naca_coordinates[j+1]
-                
-                # If between these two points
-                if x1 <= x_normalized <= x2 or x2 <= x_normalized <= x1:
-                    # Linear interpolation for y value
-                    if x2 != x1:  # Avoid division by zero
-                        if y1 >= 0 and y2 >= 0:  # Upper surface
-                            upper_y = y1 + (y2 - y1) * (x_normalized - x1) / (x2 - x1)
-                        elif y1 < 0 and y2 < 0:  # Lower surface
-                            lower_y = y1 + (y2 - y1) * (x_normalized - x1) / (x2 - x1)
-            
-            # Get total thickness (distance from upper to lower surface)
-            return upper_y - lower_y  # Return the full thickness
-        
-        # Starting and ending positions (normalized chord)
-        start_pos = 0.15  # 15% from leading edge
-        end_pos = 0.85    # 85% from leading edge
-        
-        cutouts = []
+        # Lay out the cutouts from 15% to 85% of the chord, each 70% of the
+        # local thickness and shrunk to keep a small gap between them
+        layout = layout_cutouts(naca_surfaces("0012"), count=num_cutouts, start=0.15, end=0.85,
+                                thickness_ratio=0.7, gap=0.02)
         
-        # Define a consistent circle sizing ratio (relative to airfoil thickness)
-        # This will ensure all circles are properly sized relative to the airfoil thickness
-        circle_thickness_ratio = 0.7  # Circles will be 70% of local thickness
-        
-        # Calculate and position the circles
-        for i in range(num_cutouts):
-            # Distribute positions evenly from start_pos to end_pos
-            spacing = (end_pos - start_pos) / (num_cutouts)
-            x_normalized = start_pos + spacing * (i + 0.5)  # Center of each segment
-            
-            # Get thickness at this position
-            thickness = get_airfoil_thickness(x_normalized)
-            
-            # Position in actual coordinates
-            x_pos = (x_normalized - 0.5) * chord_length
-            
-            # Radius is directly proportional to the local thickness
-            radius = (thickness * chord_length * circle_thickness_ratio) / 2
-            
-            # Store the circle information for later creation
-            cutouts.append((x_pos, radius))
-        
-        # Check and adjust radii to prevent overlaps
-        for i in range(len(cutouts) - 1):
-            x1, r1 = cutouts[i]
-            x2, r2 = cutouts[i+1]
-            
-            # Distance between centers
-            distance = abs(x2 - x1)
-            
-            # If circles would overlap
-            if distance < (r1 + r2):
-                # Reduce both radii proportionally to avoid overlap
-                # with a small gap between them
-                gap = 0.02 * chord_length  # Small gap between circles
-                scale_factor = (distance - gap) / (r1 + r2)
-                
-                # Update radii
-                cutouts[i] = (x1, r1 * scale_factor)
-                cutouts[i+1] = (x2, r2 * scale_factor)
+        # Position in actual coordinates
+        x_positions = (layout.x - 0.5) * chord_length
+        cutouts = list(zip(x_positions, layout.y * chord_length, layout.radius * chord_length))
         
         # Add circles to the airfoil
-        for x_pos, radius in cutouts:
+        for x_pos, y_pos, radius in cutouts:
             circle = Circle(
                 radius=radius,
                 color=WHITE,
@@ -1508,9 +1406,16 @@ class BeamModulousElasticityScene(ThreeDScene):
                 fill_opacity=1.0,
                 stroke_width=1.5
             )
-            circle.move_to([x_pos, 0, 0])  # Position along centerline
+            circle.move_to([x_pos, y_pos, 0])  # Position along the mean line
             tip_cross_section.add(circle)
         
+        # Properties of the section as drawn: the airfoil with the cutouts removed
+        self.tip_section_properties = section_properties([(
+            np.array(scaled_points)[:, :2],
+            [circle_outline((x_pos, y_pos), radius) for x_pos, y_pos, radius in cutouts]
+        )])
+        self.tip_section_chord = chord_length
+        
         return tip_cross_section
 
 def show_euler_bernoulli_equation(self):
@@ -1667,7 +1572,7 @@ class BeamDistributedLoadScene(Scene):
         # w(x) = -q*x^2*(6*L^2 - 4*L*x + x^2)/(24*E*I)
         def get_uniform_load_curve():
             points = []
-            num_points = 100
+            num_points = lod_samples("curve_points")
             
             for i in range(num_points + 1):
                 x_ratio = i / num_points
@@ -1799,7 +1704,7 @@ class BeamDistributedLoadScene(Scene):
         # Create deflection curve for concentrated middle load
         def get_middle_load_curve():
             points = []
-            num_points = 100
+            num_points = lod_samples("curve_points")
             
             for i in range(num_points + 1):
                 x_ratio = i / num_points
@@ -1919,7 +1824,7 @@ class BeamDistributedLoadScene(Scene):
             For a cantilever beam with elliptical loading (maximum at root).
             """
             points = []
-            num_points = 100
+            num_points = lod_samples("curve_points")
             
             for i in range(num_points + 1):
                 x_ratio = i / num_points
@@ -2444,7 +2349,7 @@ class BeamCurvatureScene(Scene):
             return p + r * n
 
         # Create the parametric curve directly
-        num_points = 100
+        num_points = lod_samples("curve_points")
         t_vals = np.linspace(t_min, t_max, num_points)
         curve_points = [curve_point(t) for t in t_vals]
         
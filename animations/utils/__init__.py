@@ -0,0 +1,2 @@
+# animations/utils/__init__.py
+"""Geometry helpers shared by the scenes."""
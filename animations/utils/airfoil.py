@@ -0,0 +1,72 @@
+# animations/utils/airfoil.py
+"""
+Batched lookups on the surfaces of an airfoil.
+
+An Airfoil keeps its upper and lower surfaces as separate arrays sorted
+by chord position, so the surface height at any number of chord
+positions is one np.interp call (a binary search per position) instead
+of a scan over the outline.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from animations.utils.lod import lod_samples
+from animations.utils.naca import naca_airfoil
+
+def sorted_surface(points):
+    """Return the chord positions and heights of a surface, sorted and without repeated positions."""
+    points = np.asarray(points, dtype=float)
+    x, first = np.unique(points[:, 0], return_index=True)
+    return x, points[first, 1]
+
+class Airfoil:
+    """
+    Upper and lower surface of an airfoil with normalized chord positions
+    (0 at the leading edge, 1 at the trailing edge). Queries take scalars
+    or arrays of chord positions; positions off the chord are clamped to
+    the leading or trailing edge.
+    """
+
+    def __init__(self, upper, lower):
+        self.upper_x, self.upper_y = sorted_surface(upper)
+        self.lower_x, self.lower_y = sorted_surface(lower)
+
+    @classmethod
+    def from_outline(cls, outline):
+        """Split an outline that runs TE -> LE -> TE at its leading edge."""
+        outline = np.asarray(outline, dtype=float)
+        leading_edge = int(np.argmin(outline[:, 0]))
+        return cls(outline[:leading_edge + 1], outline[leading_edge:])
+
+    def y_upper(self, x):
+        """Return the height of the upper surface at chord positions x."""
+        return np.interp(x, self.upper_x, self.upper_y)
+
+    def y_lower(self, x):
+        """Return the height of the lower surface at chord positions x."""
+        return np.interp(x, self.lower_x, self.lower_y)
+
+    def thickness(self, x):
+        """Return the distance between the surfaces at chord positions x."""
+        return self.y_upper(x) - self.y_lower(x)
+
+    def camber(self, x):
+        """Return the height of the mean line at chord positions x."""
+        return (self.y_upper(x) + self.y_lower(x)) / 2
+
+@lru_cache(maxsize=None)
+def build_naca_surfaces(designation, num_points):
+    """Build the Airfoil of a NACA section."""
+    airfoil = naca_airfoil(designation, num_points)
+    return Airfoil(airfoil.upper, airfoil.lower)
+
+def naca_surfaces(designation="0012", num_points=None):
+    """
+    Return the Airfoil of a NACA section, built once per designation and
+    point count; num_points defaults to the current level of detail.
+    """
+    if num_points is None:
+        num_points = lod_samples("airfoil_points")
+    return build_naca_surfaces(designation, num_points)
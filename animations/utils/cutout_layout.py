@@ -0,0 +1,105 @@
+# animations/utils/cutout_layout.py
+"""
+Layout of circular lightening holes along the mean line of an airfoil.
+
+Holes are evenly spaced between two chord positions and sized to a
+fraction of the local thickness. Every constraint is applied to all
+holes at once:
+
+- fit: each hole must stay inside its share of the thickness over its
+  whole width, not just at its centre. The radii are refined by a
+  fixed-point iteration on batched thickness queries across every hole.
+- gap: neighbouring holes keep at least gap between their edges. Each
+  pair gets the scale that makes it fit, and each hole takes the smaller
+  scale of its two pairs, so one pass leaves no pair overlapping.
+- fill: holes remove at most max_fill_ratio of the section area.
+
+Lengths are fractions of the chord, like the Airfoil they are laid out
+in.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+CutoutLayout = namedtuple("CutoutLayout", ["x", "y", "radius"])
+
+# Offsets across each hole, as fractions of its radius, where the fit to
+# the thickness is checked (the edges themselves need no room)
+FIT_SAMPLES = np.sin(np.linspace(-np.pi / 2, np.pi / 2, 11)[1:-1])
+
+def cutout_centers(start, end, count=None, spacing=None):
+    """
+    Return the chord positions of evenly spaced holes between start and
+    end, each at the middle of its share of the range. Give either the
+    number of holes or their spacing; a spacing that does not divide the
+    range leaves the same margin at both ends.
+    """
+    if (count is None) == (spacing is None):
+        raise ValueError("Give either count or spacing")
+    if count is None:
+        count = int(np.floor((end - start) / spacing + 1e-9))
+        start += ((end - start) - count * spacing) / 2
+    else:
+        spacing = (end - start) / count
+    return start + spacing * (np.arange(count) + 0.5)
+
+def fit_radii(airfoil, x, thickness_ratio, tolerance=1e-9, max_iterations=50):
+    """
+    Return the largest radii, up to thickness_ratio of the local half
+    thickness, for which each hole stays inside thickness_ratio of the
+    half thickness across its whole width.
+    """
+    half_ratio = thickness_ratio / 2
+    radii = half_ratio * airfoil.thickness(x)
+    room = np.sqrt(1 - FIT_SAMPLES**2)
+    for _ in range(max_iterations):
+        # Half height of each hole against the thickness under it, at all samples at once
+        sample_x = x[:, None] + radii[:, None] * FIT_SAMPLES
+        allowed = (half_ratio * airfoil.thickness(sample_x) / room).min(axis=1)
+        refined = np.minimum(radii, allowed)
+        if np.max(radii - refined, initial=0.0) <= tolerance:
+            return refined
+        radii = refined
+    return radii
+
+def separate_radii(x, radii, gap):
+    """Shrink the radii so that neighbouring holes keep at least gap between them."""
+    room = np.diff(x) - gap
+    if np.any(room <= 0):
+        raise ValueError(f"Holes spaced {np.diff(x).min():.4g} apart cannot keep a gap of {gap:.4g}")
+    pair_sum = radii[:-1] + radii[1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pair_scale = np.minimum(1.0, np.where(pair_sum > 0, room / pair_sum, 1.0))
+    scale = np.ones_like(radii)
+    scale[:-1] = pair_scale
+    scale[1:] = np.minimum(scale[1:], pair_scale)
+    return radii * scale
+
+def section_area(airfoil):
+    """Return the area of the airfoil, with the chord as unit length."""
+    x = np.union1d(airfoil.upper_x, airfoil.lower_x)
+    thickness = airfoil.thickness(x)
+    return np.sum((thickness[1:] + thickness[:-1]) / 2 * np.diff(x))
+
+def layout_cutouts(airfoil, count=None, spacing=None, start=0.15, end=0.85,
+                   thickness_ratio=0.7, gap=0.02, max_fill_ratio=None):
+    """
+    Lay out circular holes centred on the mean line of an Airfoil between
+    chord positions start and end, given their count or spacing. Radii are
+    thickness_ratio of the local half thickness, shrunk as needed so that
+    holes fit inside the section, keep gap between each other and remove
+    at most max_fill_ratio of the section area (no limit if None).
+    """
+    x = cutout_centers(start, end, count, spacing)
+    radii = fit_radii(airfoil, x, thickness_ratio)
+    if len(x) > 1:
+        radii = separate_radii(x, radii, gap)
+
+    if max_fill_ratio is not None:
+        fill = np.pi * np.sum(radii**2) / section_area(airfoil)
+        if fill > max_fill_ratio:
+            # Shrinking every hole alike keeps them inside and apart
+            radii = radii * np.sqrt(max_fill_ratio / fill)
+
+    return CutoutLayout(x, airfoil.camber(x), radii)
@@ -0,0 +1,136 @@
+# animations/utils/fuel_tank.py
+"""
+Fuel in the elliptical tank of the root cross-section.
+
+The fuel surface is a wave riding at 60% of the tank's upper half and
+kept within 90% of the tank's half-height above and below the centre;
+the tank bottom follows the ellipse. Heights of
+the whole wave are computed in one vectorized pass for a slosh phase,
+which moves the wave along the surface and rocks it from side to side.
+
+A FuelSurface draws the fuel as a fill, the wave and the bottom curve.
+Only the heights of the wave change with the phase, so its updater
+rewrites the existing point arrays in place, moving each point along the
+tank's up direction.
+"""
+
+from manim import BLUE, WHITE, VGroup, VMobject
+import numpy as np
+
+from animations.utils.lod import lod_samples
+from animations.utils.mesh_geometry import EDGE_WEIGHTS, polygon_outline_points
+
+# Style of the fuel, its wave and the tank bottom
+FUEL_STYLE = {
+    "color": BLUE,
+    "stroke_width": 0,
+    "fill_color": BLUE,
+    "fill_opacity": 0.7,
+}
+FUEL_LINE_STYLE = {
+    "color": WHITE,
+    "stroke_width": 1.5,
+}
+
+def fuel_surface_heights(t, tank_height, num_waves=22, phase=0.0, tilt=0.0):
+    """
+    Return the heights of the fuel wave at ellipse parameters t (-pi/2 at
+    the left of the tank, pi/2 at the right). phase travels the wave along
+    the surface; tilt (a fraction of the wave amplitude) rocks the surface
+    with sin(phase).
+    """
+    wave_amplitude = tank_height * 0.08
+    y_ellipse = (tank_height / 2) * np.cos(t)
+
+    # The wave sits at 60% of the ellipse height and stays within 90% of
+    # it on both sides, so the rocking surface never leaves the tank where
+    # the ellipse narrows at its ends
+    base_y = y_ellipse * 0.6 + tilt * wave_amplitude * np.sin(t) * np.sin(phase)
+    wave_y = base_y + wave_amplitude * np.sin(num_waves * (t + np.pi / 2) - phase)
+    return np.clip(wave_y, -y_ellipse * 0.9, y_ellipse * 0.9)
+
+def fuel_surface_points(tank_width, tank_height, num_waves=22, num_points=None, phase=0.0, tilt=0.0):
+    """
+    Return the wave on top of the fuel and the bottom of the tank as
+    (num_points, 3) arrays, both running left to right; num_points
+    defaults to the fuel_wave_points count of the level of detail.
+    """
+    if num_points is None:
+        num_points = lod_samples("fuel_wave_points")
+    t = np.linspace(-np.pi / 2, np.pi / 2, num_points)
+    x = (tank_width / 2) * np.sin(t)
+
+    wave_points = np.column_stack([x, fuel_surface_heights(t, tank_height, num_waves, phase, tilt), np.zeros_like(x)])
+    bottom_points = np.column_stack([x, -(tank_height / 2) * np.cos(t), np.zeros_like(x)])
+    return wave_points, bottom_points
+
+def edge_heights(vertex_y):
+    """
+    Return the (edges, 4) heights of the Bezier points of a closed
+    polygon with straight edges, from vertex heights.
+    """
+    return vertex_y[:, None] + EDGE_WEIGHTS * (np.roll(vertex_y, -1) - vertex_y)[:, None]
+
+class FuelSurface:
+    """
+    The fuel of an elliptical tank centred on the origin, as a VGroup of
+    the fill, the wave and the tank bottom (self.group). Call set_phase or
+    add update as an updater once the group is on screen. The group may be
+    shifted, scaled or rotated before sloshing starts: the first call finds
+    the tank's up direction from the points it has then, and heights are
+    applied as offsets along it. Transforming the group while it sloshes
+    is not supported; clear the updater first.
+    """
+
+    def __init__(self, tank_width, tank_height, num_waves=22, num_points=None, tilt=1.0, speed=2.0):
+        if num_points is None:
+            num_points = lod_samples("fuel_wave_points")
+        self.tank_height = tank_height
+        self.num_waves = num_waves
+        self.tilt = tilt
+        self.speed = speed
+        self.phase = 0.0
+        self.t = np.linspace(-np.pi / 2, np.pi / 2, num_points)
+
+        wave_points, bottom_points = fuel_surface_points(tank_width, tank_height, num_waves, num_points)
+        # The fill runs along the wave and back along the bottom
+        fill_vertices = np.concatenate([wave_points, bottom_points[::-1]])
+        self.vertex_y = fill_vertices[:, 1].copy()
+        self.rest_edge_y = edge_heights(self.vertex_y)
+
+        self.fluid_area = VMobject(**FUEL_STYLE)
+        self.fluid_area.set_points(polygon_outline_points(fill_vertices))
+        self.rest_fill_points = self.fluid_area.points.copy()
+        # The wave and the bottom are open: their closing edge is dropped
+        self.wave_curve = VMobject(**FUEL_LINE_STYLE)
+        self.wave_curve.set_points(polygon_outline_points(wave_points)[:-4])
+        self.bottom_curve = VMobject(**FUEL_LINE_STYLE)
+        self.bottom_curve.set_points(polygon_outline_points(bottom_points)[:-4])
+        self.group = VGroup(self.fluid_area, self.wave_curve, self.bottom_curve)
+
+        self.up = None
+        self.fill_base = None
+        self.wave_base = None
+
+    def set_phase(self, phase):
+        """Slosh the fuel to phase, rewriting the heights of the fill and the wave."""
+        num_wave_edges = len(self.t) - 1
+        if self.up is None:
+            # Fit the affine map from the points as built to the points now;
+            # its second row is where the group has taken the tank's y axis
+            rest = np.column_stack([self.rest_fill_points, np.ones(len(self.rest_fill_points))])
+            transform = np.linalg.lstsq(rest, self.fluid_area.points, rcond=None)[0]
+            self.up = transform[1]
+            rest_offsets = self.rest_edge_y.ravel()[:, None] * self.up
+            self.fill_base = self.fluid_area.points - rest_offsets
+            self.wave_base = self.wave_curve.points - rest_offsets[:4 * num_wave_edges]
+
+        self.phase = phase
+        self.vertex_y[:len(self.t)] = fuel_surface_heights(self.t, self.tank_height, self.num_waves, phase, self.tilt)
+        offsets = edge_heights(self.vertex_y).ravel()[:, None] * self.up
+        self.fluid_area.points[:] = self.fill_base + offsets
+        self.wave_curve.points[:] = self.wave_base + offsets[:4 * num_wave_edges]
+
+    def update(self, group, dt):
+        """Updater that advances the phase by speed * dt (radians per second)."""
+        self.set_phase(self.phase + self.speed * dt)
@@ -0,0 +1,203 @@
+# animations/utils/geometry_cache.py
+"""
+On-disk cache of generated geometry.
+
+Functions decorated with @cached_geometry return a point array (or a
+tuple of them). The result is stored as an .npz file in
+media/geometry_cache, keyed by the function's name and arguments, the
+level of detail and a hash of the file the function is defined in and
+of every module of animations.utils, so editing the builder or any
+helper it calls invalidates its entries. Repeated and parallel
+renders load the arrays instead of generating them again.
+
+Archives are written uncompressed, which lets every array be
+memory-mapped straight out of the file. Entries are written atomically
+and the least recently used ones are removed once the cache grows past
+its size limit (geometry_cache_mb in the [custom] section of manim.cfg,
+0 turns the cache off). The directory is scanned once per process; after
+that the size is tracked as entries are written and the directory is
+only scanned again when the tracked size passes the limit.
+"""
+
+import os
+import struct
+import inspect
+import hashlib
+import zipfile
+from functools import lru_cache, wraps
+
+import numpy as np
+from manim import config
+
+from animations.utils.lod import lod_level, read_custom_settings, read_overrides
+
+CACHE_DIR = "geometry_cache"
+
+DEFAULT_CACHE_MB = 256
+
+# Size of a zip local file header before its file name and extra field
+LOCAL_HEADER_SIZE = 30
+
+# Directory of the helper modules the builders depend on
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bytes in each cache directory as this process last knew them
+cache_sizes = {}
+
+def get_cache_dir():
+    """Return the geometry cache directory in the Manim media directory."""
+    return os.path.join(config.media_dir, CACHE_DIR)
+
+def get_cache_limit():
+    """Return the size limit of the cache in bytes."""
+    return int(float(read_custom_settings().get("geometry_cache_mb", DEFAULT_CACHE_MB)) * 1024 * 1024)
+
+@lru_cache(maxsize=None)
+def hash_source_file(source_file):
+    """Return a short hash of a source file's contents."""
+    with open(source_file, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+@lru_cache(maxsize=None)
+def hash_utils_sources():
+    """Return a short hash of the source of every module of animations.utils."""
+    digest = hashlib.sha1()
+    for name in sorted(os.listdir(UTILS_DIR)):
+        if name.endswith(".py"):
+            digest.update(name.encode())
+            digest.update(hash_source_file(os.path.join(UTILS_DIR, name)).encode())
+    return digest.hexdigest()[:12]
+
+def describe_argument(value):
+    """Return a stable text form of an argument; arrays and point lists are hashed."""
+    if isinstance(value, (np.ndarray, list, tuple)):
+        array = np.ascontiguousarray(value)
+        return f"array{array.shape}{array.dtype}:{hashlib.sha1(array.tobytes()).hexdigest()}"
+    return repr(value)
+
+def get_cache_key(func, args, kwargs):
+    """Return the cache key of a call: name, arguments, level of detail and source."""
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    parts = [
+        f"{func.__module__}.{func.__qualname__}",
+        hash_source_file(inspect.getsourcefile(func)),
+        hash_utils_sources(),
+        lod_level(),
+        repr(sorted(read_overrides().items())),
+    ]
+    parts += [f"{name}={describe_argument(value)}" for name, value in bound.arguments.items()]
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:20]
+
+def to_arrays(result):
+    """Turn a builder's result into the named arrays of an archive."""
+    if isinstance(result, tuple):
+        return {f"item_{i}": np.asarray(item) for i, item in enumerate(result)}
+    return {"array": np.asarray(result)}
+
+def from_arrays(arrays):
+    """Turn the named arrays of an archive back into a builder's result."""
+    if "array" in arrays:
+        return arrays["array"]
+    return tuple(arrays[f"item_{i}"] for i in range(len(arrays)))
+
+def save_arrays(path, arrays):
+    """Write arrays to an uncompressed .npz file, atomically."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(temp_path, path)
+
+def load_arrays(path):
+    """
+    Memory-map every array of an uncompressed .npz file. np.load reads
+    .npz members into memory, so the .npy header of each stored member is
+    read here and the data after it is mapped directly.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} is compressed and cannot be memory-mapped")
+            f.seek(info.header_offset)
+            local_header = f.read(LOCAL_HEADER_SIZE)
+            name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+            f.seek(info.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length)
+
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+            name = os.path.splitext(info.filename)[0]
+            if 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                                         order="F" if fortran_order else "C")
+    return arrays
+
+def evict_entries(cache_dir, limit):
+    """
+    Remove the least recently used entries until the cache fits its
+    limit. Returns the size of the entries that are left.
+    """
+    entries = []
+    with os.scandir(cache_dir) as dir_entries:
+        for entry in dir_entries:
+            if entry.name.endswith(".npz"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Evicted by a parallel render
+            pass
+        total -= size
+    return total
+
+def record_entry(cache_dir, limit, size):
+    """
+    Count a new entry of size bytes towards the cache size, scanning the
+    directory and evicting entries on the first call and whenever the
+    count passes the limit.
+    """
+    if cache_dir in cache_sizes:
+        cache_sizes[cache_dir] += size
+        if cache_sizes[cache_dir] <= limit:
+            return
+    cache_sizes[cache_dir] = evict_entries(cache_dir, limit)
+
+def cached_geometry(func):
+    """Cache the point arrays a geometry builder returns on disk."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        limit = get_cache_limit()
+        if limit <= 0:
+            return func(*args, **kwargs)
+
+        cache_dir = get_cache_dir()
+        path = os.path.join(cache_dir, f"{func.__name__}_{get_cache_key(func, args, kwargs)}.npz")
+        try:
+            arrays = load_arrays(path)
+            # Mark the entry as recently used
+            os.utime(path)
+            return from_arrays(arrays)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            pass
+
+        arrays = to_arrays(func(*args, **kwargs))
+        save_arrays(path, arrays)
+        # Read-only, like the memory-mapped arrays of a cache hit
+        for array in arrays.values():
+            array.setflags(write=False)
+        record_entry(cache_dir, limit, sum(array.nbytes for array in arrays.values()))
+        return from_arrays(arrays)
+    return wrapper
@@ -0,0 +1,90 @@
+# animations/utils/lod.py
+"""
+Level of detail of the procedural geometry.
+
+Every curve and mesh the scenes build takes its sample count from here,
+so low-quality previews use coarse geometry and 4K renders use fine
+geometry. The level follows the quality Manim is rendering at and can be
+overridden in the [custom] section of manim.cfg:
+
+    [custom]
+    lod = high                  ; force a level at every quality
+    lod_wing_span_segments = 40 ; pin one sample count
+"""
+
+import os
+from configparser import ConfigParser
+from functools import lru_cache
+
+from manim import config
+
+LOD_LEVELS = ("low", "medium", "high", "fourk")
+
+# Sample counts at each level, in the order of LOD_LEVELS. The high
+# level holds the counts the scenes were designed with.
+LOD_SAMPLES = {
+    # Points on each surface of a generated airfoil
+    "airfoil_points": (30, 45, 60, 90),
+    # Span segments of the wing mesh
+    "wing_span_segments": (10, 20, 30, 45),
+    # Points along the beam deflection and load curves
+    "curve_points": (40, 70, 100, 150),
+    # Points along the fuel surface wave (22 crests, so never below ~3 per crest)
+    "fuel_wave_points": (70, 85, 100, 150),
+    # Facets around and along the cylinder beam
+    "cylinder_resolution": (10, 16, 20, 32),
+    # Span stations of the wing's second moment of area distribution
+    "spanwise_stations": (250, 500, 1000, 2000),
+}
+
+# Manim quality names and the level they render at
+QUALITY_LEVELS = {
+    "example_quality": "low",
+    "low_quality": "low",
+    "medium_quality": "medium",
+    "high_quality": "high",
+    "production_quality": "fourk",
+    "fourk_quality": "fourk",
+}
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "manim.cfg")
+
+@lru_cache(maxsize=None)
+def read_custom_settings(config_file=CONFIG_FILE):
+    """Return the settings of the [custom] section of manim.cfg."""
+    parser = ConfigParser(inline_comment_prefixes=(";", "#"))
+    parser.read(config_file)
+    if not parser.has_section("custom"):
+        return {}
+    return dict(parser.items("custom"))
+
+def read_overrides():
+    """Return the lod settings of the [custom] section of manim.cfg."""
+    return {key: value for key, value in read_custom_settings().items() if key == "lod" or key.startswith("lod_")}
+
+def lod_level():
+    """Return the level of detail of the quality being rendered."""
+    level = read_overrides().get("lod")
+    if level:
+        if level not in LOD_LEVELS:
+            raise ValueError(f"lod in manim.cfg must be one of {', '.join(LOD_LEVELS)}, not {level}")
+        return level
+
+    if config.quality in QUALITY_LEVELS:
+        return QUALITY_LEVELS[config.quality]
+    # Custom resolutions take the level of the nearest standard height
+    height = config.pixel_height
+    if height <= 480:
+        return "low"
+    if height <= 720:
+        return "medium"
+    if height <= 1080:
+        return "high"
+    return "fourk"
+
+def lod_samples(name):
+    """Return the sample count of a geometry at the current level of detail."""
+    override = read_overrides().get(f"lod_{name}")
+    if override:
+        return int(override)
+    return LOD_SAMPLES[name][LOD_LEVELS.index(lod_level())]
@@ -0,0 +1,85 @@
+# animations/utils/mesh_geometry.py
+"""
+Compact storage of large polygon meshes.
+
+A VMobject keeps four float64 Bezier points per edge of every face, so
+a quad costs 384 bytes of points and each vertex is repeated in every
+face around it. MeshGeometry keeps the mesh as one float32 vertex array
+and one int32 face array instead, about 30 bytes per quad, with the
+faces grouped into batches that each become one VMobject.
+
+This is the form meshes are cached and exported in. Points are
+materialised per batch for the batches a caller builds; once built, a
+VMobject holds its float64 points like any other.
+"""
+
+from manim import VGroup, VMobject
+import numpy as np
+
+# Anchor and handle positions along a straight edge, as Polygon sets them
+EDGE_WEIGHTS = np.linspace(0.0, 1.0, 4)
+
+# Bytes of the float64 Bezier points of one face edge in a VMobject
+POINT_BYTES_PER_EDGE = 4 * 3 * 8
+
+def polygon_outline_points(corners):
+    """
+    Return the Bezier points that outline polygons as closed paths: one
+    straight cubic curve (four points) per edge, from each corner to the
+    next and from the last back to the first.
+    """
+    ends = np.roll(corners, -1, axis=-2)
+    points = corners[..., None, :] + EDGE_WEIGHTS[:, None] * (ends - corners)[..., None, :]
+    return points.reshape(*corners.shape[:-2], 4 * corners.shape[-2], 3)
+
+class MeshGeometry:
+    """
+    Vertices (float32), faces (int32 vertex indices, all with the same
+    number of corners) and the offsets at which each batch of faces
+    starts, ending with the number of faces.
+    """
+
+    def __init__(self, vertices, faces, batch_starts):
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self.faces = np.ascontiguousarray(faces, dtype=np.int32)
+        self.batch_starts = np.ascontiguousarray(batch_starts, dtype=np.int32)
+
+    @property
+    def num_batches(self):
+        return len(self.batch_starts) - 1
+
+    def batch_faces(self, batch):
+        """Return the faces of a batch, as a view of the face array."""
+        return self.faces[self.batch_starts[batch]:self.batch_starts[batch + 1]]
+
+    def batch_points(self, batch):
+        """Return the float64 Bezier points that outline the faces of a batch."""
+        corners = self.vertices[self.batch_faces(batch)].astype(float)
+        return polygon_outline_points(corners).reshape(-1, 3)
+
+    def to_mobject(self, style, batches=None):
+        """
+        Build a VGroup with one VMobject per batch, materialising the
+        points of the given batches only (all of them if None).
+        """
+        if batches is None:
+            batches = range(self.num_batches)
+        group = []
+        for batch in batches:
+            mob = VMobject(**style)
+            mob.set_points(self.batch_points(batch))
+            group.append(mob)
+        return VGroup(*group)
+
+    def memory_use(self, batches=None):
+        """
+        Return the bytes held by the geometry and the bytes of float64
+        points its batches take once materialised (all of them if None).
+        """
+        if batches is None:
+            batches = range(self.num_batches)
+        face_counts = np.diff(self.batch_starts)[np.asarray(batches, dtype=int)]
+        return {
+            "geometry": self.vertices.nbytes + self.faces.nbytes + self.batch_starts.nbytes,
+            "points": int(face_counts.sum()) * self.faces.shape[1] * POINT_BYTES_PER_EDGE,
+        }
@@ -0,0 +1,293 @@
+# animations/utils/mesh_io.py
+"""
+Export and import of polygon meshes as binary glTF (.glb) and OBJ.
+
+Procedural 3D geometry (the wing mesh, Prism and Cylinder faces) is made
+of VMobjects whose subpaths are straight-edged faces. A Mesh collects
+those faces as a shared float32 vertex array and one int32 face array
+per batch, a batch being the faces of one VMobject with the same number
+of corners. Batches are kept through the round trip, as glTF primitives
+or OBJ groups, and each one is rebuilt as a single VMobject, so an
+imported wing renders like the built one. Curved edges are not kept:
+every face is saved as the polygon through its corners.
+
+glTF is Y-up and the scenes are Z-up, so points are saved as
+(x, z, -y) and turned back on import. Quads are split into two
+triangles for glTF and joined again on import; OBJ keeps them as they
+are. Reading and writing work on whole arrays, without Python loops
+over vertices or faces.
+"""
+
+from collections import namedtuple
+import io
+import json
+import re
+import struct
+
+from manim import VGroup, VMobject
+import numpy as np
+
+from animations.utils.mesh_geometry import MeshGeometry, polygon_outline_points
+from animations.utils.wing_mesh import WING_STYLE
+
+# faces holds one (faces, corners) int32 array of vertex indices per batch
+Mesh = namedtuple("Mesh", ["vertices", "faces"])
+
+# Subpaths whose ends are closer than this are joined into one face
+JOIN_TOLERANCE = 1e-6
+
+GLB_MAGIC = b"glTF"
+GLB_VERSION = 2
+GLB_JSON_CHUNK = 0x4E4F534A
+GLB_BIN_CHUNK = 0x004E4942
+GLTF_FLOAT = 5126
+GLTF_UNSIGNED_INT = 5125
+GLTF_TRIANGLES = 4
+GLTF_ARRAY_BUFFER = 34962
+GLTF_ELEMENT_ARRAY_BUFFER = 34963
+GLTF_COMPONENT_TYPES = {5120: np.int8, 5121: np.uint8, 5122: np.int16, 5123: np.uint16, 5125: np.uint32, 5126: np.float32}
+
+# Scene (x, y, z) to glTF (x, z, -y) and back
+TO_Y_UP = np.array([[1, 0, 0], [0, 0, 1], [0, -1, 0]], dtype=np.float32)
+TO_Z_UP = TO_Y_UP.T
+
+def mobject_faces(mobject):
+    """
+    Return the corners of the faces of every VMobject in the family of
+    mobject, as a list of (faces, corners, 3) arrays: one per VMobject
+    and number of corners.
+    """
+    batches = []
+    for mob in mobject.family_members_with_points():
+        points = mob.points
+        starts, ends = points[0::4], points[3::4]
+        # A face starts where a curve does not continue the one before
+        new_face = np.ones(len(starts), dtype=bool)
+        new_face[1:] = np.any(np.abs(starts[1:] - ends[:-1]) > JOIN_TOLERANCE, axis=1)
+        first = np.flatnonzero(new_face)
+        sizes = np.diff(np.append(first, len(starts)))
+        for corners in np.unique(sizes):
+            face_first = first[sizes == corners]
+            batches.append(starts[face_first[:, None] + np.arange(corners)])
+    return batches
+
+def faces_to_mesh(batches):
+    """Build a Mesh from face corners, sharing vertices that are equal in float32."""
+    corners = np.concatenate([batch.reshape(-1, 3) for batch in batches]).astype(np.float32)
+    vertices, index = np.unique(corners, axis=0, return_inverse=True)
+    index = index.reshape(-1).astype(np.int32)
+
+    faces = []
+    start = 0
+    for batch in batches:
+        end = start + batch.shape[0] * batch.shape[1]
+        faces.append(index[start:end].reshape(batch.shape[:2]))
+        start = end
+    return Mesh(vertices, faces)
+
+def mobject_mesh(mobject):
+    """Return the Mesh of the straight-edged faces of a mobject and its family."""
+    return faces_to_mesh(mobject_faces(mobject))
+
+def geometry_mesh(geometry):
+    """Return a MeshGeometry as a Mesh, with one view of its face array per batch."""
+    return Mesh(geometry.vertices, np.split(geometry.faces, geometry.batch_starts[1:-1]))
+
+def mesh_to_mobject(mesh, style=WING_STYLE):
+    """
+    Build a VGroup with one VMobject per batch of a Mesh, each holding
+    its faces as closed subpaths.
+    """
+    vertices = mesh.vertices.astype(float)
+    batches = []
+    for faces in mesh.faces:
+        batch = VMobject(**style)
+        batch.set_points(polygon_outline_points(vertices[faces]).reshape(-1, 3))
+        batches.append(batch)
+    return VGroup(*batches)
+
+def triangulate(faces):
+    """Split (faces, corners) polygons into fans of triangles: corners - 2 per face."""
+    corners = faces.shape[1]
+    fan = np.stack([np.zeros(corners - 2, dtype=int), np.arange(1, corners - 1), np.arange(2, corners)], axis=1)
+    return faces[:, fan].reshape(-1, 3)
+
+def untriangulate(triangles, corners):
+    """Join the fans written by triangulate back into (faces, corners) polygons."""
+    fans = triangles.reshape(-1, corners - 2, 3)
+    return np.concatenate([fans[:, 0, :2], fans[:, :, 2]], axis=1)
+
+def padded(data, fill):
+    """Pad bytes to a multiple of 4, as glTF chunks and buffer views require."""
+    return data + fill * (-len(data) % 4)
+
+def save_gltf(mesh, path):
+    """Write a Mesh as binary glTF, one triangle primitive per batch."""
+    positions = np.ascontiguousarray(mesh.vertices @ TO_Y_UP.T, dtype=np.float32)
+    triangles = [triangulate(faces).astype(np.uint32) for faces in mesh.faces]
+    position_bytes = positions.tobytes()
+    index_bytes = b"".join(batch.tobytes() for batch in triangles)
+
+    index_offsets = np.cumsum([0] + [batch.nbytes for batch in triangles])
+    accessors = [{
+        "bufferView": 0,
+        "componentType": GLTF_FLOAT,
+        "count": len(positions),
+        "type": "VEC3",
+        "min": positions.min(axis=0).tolist(),
+        "max": positions.max(axis=0).tolist(),
+    }]
+    primitives = []
+    for batch, faces, offset in zip(triangles, mesh.faces, index_offsets):
+        primitives.append({
+            "attributes": {"POSITION": 0},
+            "indices": len(accessors),
+            "mode": GLTF_TRIANGLES,
+            "extras": {"corners": int(faces.shape[1])},
+        })
+        accessors.append({
+            "bufferView": 1,
+            "byteOffset": int(offset),
+            "componentType": GLTF_UNSIGNED_INT,
+            "count": batch.size,
+            "type": "SCALAR",
+        })
+
+    gltf = {
+        "asset": {"version": "2.0", "generator": "beam_bending_visualizations"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": primitives}],
+        "accessors": accessors,
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": len(position_bytes), "target": GLTF_ARRAY_BUFFER},
+            {"buffer": 0, "byteOffset": len(position_bytes), "byteLength": len(index_bytes),
+             "target": GLTF_ELEMENT_ARRAY_BUFFER},
+        ],
+        "buffers": [{"byteLength": len(position_bytes) + len(index_bytes)}],
+    }
+
+    json_chunk = padded(json.dumps(gltf, separators=(",", ":")).encode(), b" ")
+    bin_chunk = padded(position_bytes + index_bytes, b"\0")
+    length = 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+    with open(path, "wb") as file:
+        file.write(struct.pack("<4sII", GLB_MAGIC, GLB_VERSION, length))
+        file.write(struct.pack("<II", len(json_chunk), GLB_JSON_CHUNK) + json_chunk)
+        file.write(struct.pack("<II", len(bin_chunk), GLB_BIN_CHUNK) + bin_chunk)
+
+def read_accessor(gltf, binary, index):
+    """Return the data of a glTF accessor as an array, without copying when tightly packed."""
+    accessor = gltf["accessors"][index]
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    dtype = np.dtype(GLTF_COMPONENT_TYPES[accessor["componentType"]])
+    width = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4}[accessor["type"]]
+    offset = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+    stride = view.get("byteStride", dtype.itemsize * width)
+
+    count = accessor["count"]
+    rows = np.ndarray((count, width), dtype=dtype, buffer=binary, offset=offset,
+                      strides=(stride, dtype.itemsize))
+    return rows if width > 1 else rows[:, 0]
+
+def load_gltf(path):
+    """Read the triangle primitives of the first mesh of a binary glTF file as a Mesh."""
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, version, _ = struct.unpack_from("<4sII", data)
+    if magic != GLB_MAGIC or version != GLB_VERSION:
+        raise ValueError(f"Not a binary glTF 2.0 file: {path}")
+
+    json_length, _ = struct.unpack_from("<II", data, 12)
+    gltf = json.loads(data[20:20 + json_length])
+    bin_length, _ = struct.unpack_from("<II", data, 20 + json_length)
+    binary = memoryview(data)[28 + json_length:28 + json_length + bin_length]
+
+    primitives = gltf["meshes"][0]["primitives"]
+    if any(primitive.get("mode", GLTF_TRIANGLES) != GLTF_TRIANGLES for primitive in primitives):
+        raise ValueError(f"Only triangle primitives can be read: {path}")
+    # All primitives written by save_gltf share one position accessor
+    position_accessors = {primitive["attributes"]["POSITION"] for primitive in primitives}
+
+    vertex_blocks = []
+    faces = []
+    base = 0
+    for accessor in sorted(position_accessors):
+        positions = read_accessor(gltf, binary, accessor)
+        for primitive in primitives:
+            if primitive["attributes"]["POSITION"] != accessor:
+                continue
+            triangles = read_accessor(gltf, binary, primitive["indices"]).astype(np.int32).reshape(-1, 3)
+            corners = primitive.get("extras", {}).get("corners", 3)
+            faces.append(untriangulate(triangles, corners) + base)
+        vertex_blocks.append(positions)
+        base += len(positions)
+
+    vertices = np.concatenate(vertex_blocks).astype(np.float32) @ TO_Z_UP.T
+    return Mesh(np.ascontiguousarray(vertices, dtype=np.float32), faces)
+
+def save_obj(mesh, path):
+    """Write a Mesh as OBJ, one group of polygon faces per batch."""
+    text = io.StringIO()
+    text.write("# beam_bending_visualizations mesh\n")
+    np.savetxt(text, mesh.vertices, fmt="v %.7g %.7g %.7g")
+    for number, faces in enumerate(mesh.faces):
+        text.write(f"g batch_{number}\n")
+        np.savetxt(text, faces + 1, fmt="f" + " %d" * faces.shape[1])
+    with open(path, "w") as file:
+        file.write(text.getvalue())
+
+def load_obj(path):
+    """
+    Read the vertices and polygon faces of an OBJ file as a Mesh, one
+    batch per group (g or o) and number of corners.
+    """
+    with open(path) as file:
+        text = re.sub(r"#[^\n]*", "", file.read())
+    tokens = np.array(text.split())
+    # Statements start with a keyword; everything else is an argument
+    is_keyword = np.char.isalpha(tokens)
+    statements = np.flatnonzero(is_keyword)
+    keywords = tokens[statements]
+    arguments = np.diff(np.append(statements, len(tokens))) - 1
+
+    vertex_statements = statements[keywords == "v"]
+    vertices = tokens[vertex_statements[:, None] + np.arange(1, 4)].astype(np.float32)
+
+    face_statements = statements[keywords == "f"]
+    face_sizes = arguments[keywords == "f"]
+    group_statements = statements[(keywords == "g") | (keywords == "o")]
+    group = np.searchsorted(group_statements, face_statements)
+
+    faces = []
+    for number in np.unique(group):
+        for corners in np.unique(face_sizes[group == number]):
+            selected = face_statements[(group == number) & (face_sizes == corners)]
+            references = tokens[selected[:, None] + np.arange(1, corners + 1)]
+            index = np.char.partition(references, "/")[..., 0].astype(np.int64)
+            # Negative references count back from the vertices defined so far
+            defined = np.searchsorted(vertex_statements, selected)[:, None]
+            index = np.where(index < 0, defined + index, index - 1)
+            faces.append(index.astype(np.int32))
+    return Mesh(vertices, faces)
+
+def save_mesh(source, path):
+    """Export a MeshGeometry, or the faces of a mobject, to a .glb or .obj file by its extension."""
+    mesh = geometry_mesh(source) if isinstance(source, MeshGeometry) else mobject_mesh(source)
+    if path.lower().endswith(".glb"):
+        save_gltf(mesh, path)
+    elif path.lower().endswith(".obj"):
+        save_obj(mesh, path)
+    else:
+        raise ValueError(f"Meshes are saved as .glb or .obj: {path}")
+    return mesh
+
+def load_mesh(path, style=WING_STYLE):
+    """Import a .glb or .obj file as a VGroup with one VMobject per batch."""
+    if path.lower().endswith(".glb"):
+        mesh = load_gltf(path)
+    elif path.lower().endswith(".obj"):
+        mesh = load_obj(path)
+    else:
+        raise ValueError(f"Meshes are loaded from .glb or .obj: {path}")
+    return mesh_to_mobject(mesh, style)
@@ -0,0 +1,144 @@
+# animations/utils/naca.py
+"""
+NACA 4- and 5-digit airfoils.
+
+Coordinates are generated from the NACA thickness and camber equations
+with cosine spacing, which clusters points at the leading and trailing
+edges where the surface curves most. Chord positions run from 0 (leading
+edge) to 1 (trailing edge) and are normalized by the chord, like the
+rest of the scene geometry.
+
+Generated airfoils are memoised and their arrays are read-only, so asking
+for the same airfoil again costs a dictionary lookup.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from animations.utils.lod import lod_samples
+
+# upper and lower run from the leading edge to the trailing edge; outline
+# runs trailing edge -> upper surface -> leading edge -> lower surface ->
+# trailing edge and ends on its first point
+NacaAirfoil = namedtuple("NacaAirfoil", ["designation", "upper", "lower", "outline"])
+
+# Thickness polynomial coefficients; the last one closes the trailing edge
+THICKNESS_COEFFICIENTS = (0.2969, -0.1260, -0.3516, 0.2843, -0.1015)
+CLOSED_TRAILING_EDGE_COEFFICIENT = -0.1036
+
+# 5-digit mean lines designed for a lift coefficient of 0.3, by the
+# position digit: (m, k1) of the standard lines and (m, k1, k2/k1) of the
+# reflexed ones
+FIVE_DIGIT_STANDARD = {
+    1: (0.0580, 361.400),
+    2: (0.1260, 51.640),
+    3: (0.2025, 15.957),
+    4: (0.2900, 6.643),
+    5: (0.3910, 3.230),
+}
+FIVE_DIGIT_REFLEXED = {
+    2: (0.1300, 51.990, 0.000764),
+    3: (0.2170, 15.793, 0.00677),
+    4: (0.3180, 6.520, 0.0303),
+    5: (0.4410, 3.191, 0.1355),
+}
+
+def cosine_spacing(num_points):
+    """Return num_points chord positions from 0 to 1, clustered at both ends."""
+    beta = np.linspace(0.0, np.pi, num_points)
+    return 0.5 * (1.0 - np.cos(beta))
+
+def thickness_distribution(x, thickness, closed_trailing_edge=True):
+    """Return the half thickness of a NACA section at chord positions x."""
+    a0, a1, a2, a3, a4 = THICKNESS_COEFFICIENTS
+    if closed_trailing_edge:
+        a4 = CLOSED_TRAILING_EDGE_COEFFICIENT
+    return 5 * thickness * (a0 * np.sqrt(x) + x * (a1 + x * (a2 + x * (a3 + x * a4))))
+
+def four_digit_camber(x, max_camber, camber_position):
+    """Return the mean line and its slope of a NACA 4-digit section."""
+    m, p = max_camber, camber_position
+    if m == 0 or p == 0:
+        return np.zeros_like(x), np.zeros_like(x)
+
+    front = x < p
+    camber = np.where(front, m / p**2 * (2 * p * x - x**2), m / (1 - p)**2 * (1 - 2 * p + 2 * p * x - x**2))
+    slope = np.where(front, 2 * m / p**2 * (p - x), 2 * m / (1 - p)**2 * (p - x))
+    return camber, slope
+
+def five_digit_camber(x, design_lift, position_digit, reflexed):
+    """Return the mean line and its slope of a NACA 5-digit section."""
+    table = FIVE_DIGIT_REFLEXED if reflexed else FIVE_DIGIT_STANDARD
+    if position_digit not in table:
+        raise ValueError(f"No {'reflexed ' if reflexed else ''}NACA 5-digit mean line for position digit {position_digit}")
+
+    scale = design_lift / 0.3
+    if reflexed:
+        m, k1, k2_k1 = FIVE_DIGIT_REFLEXED[position_digit]
+    else:
+        (m, k1), k2_k1 = FIVE_DIGIT_STANDARD[position_digit], None
+    k1 *= scale
+
+    front = x < m
+    if k2_k1 is None:
+        camber = np.where(front, k1 / 6 * (x**3 - 3 * m * x**2 + m**2 * (3 - m) * x), k1 * m**3 / 6 * (1 - x))
+        slope = np.where(front, k1 / 6 * (3 * x**2 - 6 * m * x + m**2 * (3 - m)), -k1 * m**3 / 6)
+    else:
+        tail = k2_k1 * (1 - m)**3 + m**3
+        camber = np.where(front,
+                          k1 / 6 * ((x - m)**3 - tail * x + m**3),
+                          k1 / 6 * (k2_k1 * (x - m)**3 - tail * x + m**3))
+        slope = np.where(front,
+                         k1 / 6 * (3 * (x - m)**2 - tail),
+                         k1 / 6 * (3 * k2_k1 * (x - m)**2 - tail))
+    return camber, slope
+
+def read_only(array):
+    """Return a contiguous read-only copy of an array."""
+    array = np.ascontiguousarray(array)
+    array.setflags(write=False)
+    return array
+
+@lru_cache(maxsize=None)
+def generate_naca_airfoil(designation, num_points, closed_trailing_edge=True):
+    """
+    Generate a NACA 4-digit (e.g. "2412") or 5-digit (e.g. "23012")
+    airfoil with num_points points on each surface.
+    """
+    if not designation.isdigit() or len(designation) not in (4, 5):
+        raise ValueError(f"Not a NACA 4- or 5-digit designation: {designation}")
+
+    x = cosine_spacing(num_points)
+    thickness = int(designation[-2:]) / 100
+    if len(designation) == 4:
+        camber, slope = four_digit_camber(x, int(designation[0]) / 100, int(designation[1]) / 10)
+    else:
+        reflex_digit = int(designation[2])
+        if reflex_digit not in (0, 1):
+            raise ValueError(f"The third digit of a NACA 5-digit designation must be 0 or 1: {designation}")
+        camber, slope = five_digit_camber(x, int(designation[0]) * 0.15, int(designation[1]), reflex_digit == 1)
+
+    half_thickness = thickness_distribution(x, thickness, closed_trailing_edge)
+    if closed_trailing_edge:
+        # The polynomial leaves a rounding residue at x = 1
+        half_thickness[-1] = 0.0
+    theta = np.arctan(slope)
+    upper = np.column_stack([x - half_thickness * np.sin(theta), camber + half_thickness * np.cos(theta)])
+    lower = np.column_stack([x + half_thickness * np.sin(theta), camber - half_thickness * np.cos(theta)])
+
+    # Both surfaces start at the leading edge, so it is listed once
+    outline = np.concatenate([upper[::-1], lower[1:]])
+    if not np.array_equal(outline[0], outline[-1]):
+        outline = np.concatenate([outline, outline[:1]])
+    return NacaAirfoil(designation, read_only(upper), read_only(lower), read_only(outline))
+
+def naca_airfoil(designation="0012", num_points=None, closed_trailing_edge=True):
+    """
+    Return a NACA airfoil; num_points per surface defaults to the
+    airfoil_points count of the current level of detail.
+    """
+    if num_points is None:
+        num_points = lod_samples("airfoil_points")
+    return generate_naca_airfoil(designation, num_points, closed_trailing_edge)
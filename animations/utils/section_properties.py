@@ -0,0 +1,139 @@
+# animations/utils/section_properties.py
+"""
+Area, centroid and second moments of polygonal cross-sections.
+
+Properties follow from Green's theorem as sums over the edges of each
+section's outline and holes. All edges of a batch of sections are
+processed together: each edge's terms are computed in one vectorized
+pass and summed per section with np.bincount, so a batch costs about as
+much as its largest section.
+
+Sections are polygons in the (y, z) plane of the cross-section, given as
+(n, 2) arrays of points in either winding order; a repeated closing
+point is harmless. Second moments are about axes through the centroid:
+iyy = ∫ z^2 dA (bending about the horizontal axis), izz = ∫ y^2 dA and
+iyz = ∫ y z dA.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+SectionProperties = namedtuple(
+    "SectionProperties", ["area", "centroid_y", "centroid_z", "iyy", "izz", "iyz"]
+)
+
+def circle_outline(center, radius, num_points=64):
+    """Return the points of a regular polygon approximating a circle."""
+    angles = np.linspace(0.0, 2 * np.pi, num_points, endpoint=False)
+    return np.column_stack([center[0] + radius * np.cos(angles), center[1] + radius * np.sin(angles)])
+
+def ellipse_outline(center, width, height, num_points=64):
+    """Return the points of a polygon approximating an ellipse."""
+    angles = np.linspace(0.0, 2 * np.pi, num_points, endpoint=False)
+    return np.column_stack([center[0] + width / 2 * np.cos(angles), center[1] + height / 2 * np.sin(angles)])
+
+def edge_sums(y0, z0, y1, z1, weight, section_index, num_sections):
+    """
+    Sum the Green's theorem terms of every edge into the moments of its
+    section about the origin of the points; weight orients each edge's ring (+1 for
+    material, -1 for holes).
+    """
+    cross = (y0 * z1 - y1 * z0) * weight
+
+    def total(terms):
+        return np.bincount(section_index, terms * cross, minlength=num_sections)
+
+    area = total(np.full_like(cross, 1 / 2))
+    first_y = total((y0 + y1) / 6)
+    first_z = total((z0 + z1) / 6)
+    iyy = total((z0 * z0 + z0 * z1 + z1 * z1) / 12)
+    izz = total((y0 * y0 + y0 * y1 + y1 * y1) / 12)
+    iyz = total((y0 * z1 + 2 * y0 * z0 + 2 * y1 * z1 + y1 * z0) / 24)
+    return area, first_y, first_z, iyy, izz, iyz
+
+def about_centroid(reference, area, first_y, first_z, iyy, izz, iyz):
+    """
+    Move moments about each section's reference point to its centroid
+    (parallel axis theorem) and place the centroid back in section
+    coordinates.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centroid_y = first_y / area
+        centroid_z = first_z / area
+    return SectionProperties(
+        area,
+        reference[:, 0] + centroid_y,
+        reference[:, 1] + centroid_z,
+        iyy - area * centroid_z**2,
+        izz - area * centroid_y**2,
+        iyz - area * centroid_y * centroid_z,
+    )
+
+def polygon_batch_properties(polygons):
+    """
+    Return the properties of a (sections, points, 2) batch of simple
+    polygons without holes that all have the same number of points.
+    """
+    polygons = np.asarray(polygons, dtype=float)
+    # Sum about a point of each section, which keeps the sums small
+    reference = polygons[:, 0]
+    local = polygons - reference[:, None]
+    y0, z0 = local[..., 0], local[..., 1]
+    y1, z1 = np.roll(y0, -1, axis=-1), np.roll(z0, -1, axis=-1)
+    cross = y0 * z1 - y1 * z0
+    # Counter-clockwise and clockwise outlines both count as material
+    weight = np.sign(cross.sum(axis=-1, keepdims=True))
+
+    num_sections, num_points = y0.shape
+    section_index = np.repeat(np.arange(num_sections), num_points)
+    return about_centroid(reference, *edge_sums(
+        y0.ravel(), z0.ravel(), y1.ravel(), z1.ravel(),
+        np.broadcast_to(weight, y0.shape).ravel(), section_index, num_sections
+    ))
+
+def section_properties(sections):
+    """
+    Return the properties of a batch of sections as arrays, one value per
+    section. Each section is an outline, or a tuple (outline, holes) with
+    a list of hole outlines. A (sections, points, 2) array is taken as a
+    batch of outlines without holes.
+    """
+    if isinstance(sections, np.ndarray) and sections.ndim == 3:
+        return polygon_batch_properties(sections)
+
+    rings = []
+    ring_sections = []
+    ring_roles = []
+    outline_rings = []
+    for index, section in enumerate(sections):
+        outline, holes = section if isinstance(section, tuple) else (section, ())
+        outline_rings.append(len(rings))
+        for ring, role in [(outline, 1.0)] + [(hole, -1.0) for hole in holes]:
+            rings.append(np.asarray(ring, dtype=float))
+            ring_sections.append(index)
+            ring_roles.append(role)
+
+    lengths = np.array([len(ring) for ring in rings])
+    ring_starts = np.cumsum(lengths) - lengths
+    ring_ends = ring_starts + lengths - 1
+    points = np.concatenate(rings)
+
+    # Each edge runs to the next point of its own ring
+    next_index = np.arange(len(points)) + 1
+    next_index[ring_ends] = ring_starts
+
+    ring_index = np.repeat(np.arange(len(rings)), lengths)
+    section_index = np.array(ring_sections)[ring_index]
+
+    # Sum about the first point of each outline, which keeps the sums small
+    reference = points[ring_starts[outline_rings]]
+    local = points - reference[section_index]
+    y0, z0 = local[:, 0], local[:, 1]
+    y1, z1 = y0[next_index], z0[next_index]
+
+    # Orient every ring: outlines add material, holes remove it
+    ring_area = np.bincount(ring_index, y0 * z1 - y1 * z0, minlength=len(rings))
+    weight = (np.array(ring_roles) * np.sign(ring_area))[ring_index]
+
+    return about_centroid(reference, *edge_sums(y0, z0, y1, z1, weight, section_index, len(sections)))
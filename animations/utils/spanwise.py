@@ -0,0 +1,67 @@
+# animations/utils/spanwise.py
+"""
+Section properties along the span of a wing and integrals over the span.
+
+A wing is described by a function that returns the SectionProperties of
+its sections at an array of span positions, all in one batched call.
+The distribution is sampled at many stations at once; quantities that
+integrate a property along the span use adaptive quadrature
+(scipy.integrate.quad), which places its evaluations where the
+integrand changes fastest instead of on a fixed grid.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy.integrate import quad
+
+from animations.utils.lod import lod_samples
+
+SpanIntegral = namedtuple("SpanIntegral", ["value", "error", "evaluations"])
+
+def spanwise_stations(length, num_stations=None):
+    """
+    Return evenly spaced stations from root (0) to tip (length);
+    num_stations defaults to the spanwise_stations count of the level of detail.
+    """
+    if num_stations is None:
+        num_stations = lod_samples("spanwise_stations")
+    return np.linspace(0.0, length, num_stations)
+
+def sample_span(properties_at, length, num_stations=None):
+    """Return the stations along the span and the section properties at all of them."""
+    x = spanwise_stations(length, num_stations)
+    return x, properties_at(x)
+
+def property_at(properties_at, name):
+    """Return a function of one span position giving one section property."""
+    def value(x):
+        return float(getattr(properties_at(np.array([x])), name)[0])
+    return value
+
+def span_integral(integrand, length, tolerance=1e-8):
+    """Integrate a function of the span position from root to tip with adaptive quadrature."""
+    evaluations = 0
+
+    def counted(x):
+        nonlocal evaluations
+        evaluations += 1
+        return integrand(x)
+
+    value, error = quad(counted, 0.0, length, epsabs=0.0, epsrel=tolerance, limit=200)
+    return SpanIntegral(value, error, evaluations)
+
+def wing_volume(properties_at, length, tolerance=1e-8):
+    """Return the volume of a solid wing, the integral of the section area along the span."""
+    return span_integral(property_at(properties_at, "area"), length, tolerance)
+
+def cantilever_tip_deflection(properties_at, length, load=1.0, modulus=1.0, tolerance=1e-8):
+    """
+    Return the tip deflection of the wing as a cantilever under a uniform
+    load per unit span, by the unit load method:
+    w_tip = load / (2 * modulus) * integral of (length - x)^3 / iyy(x).
+    """
+    iyy = property_at(properties_at, "iyy")
+    integral = span_integral(lambda x: (length - x)**3 / iyy(x), length, tolerance)
+    scale = load / (2 * modulus)
+    return SpanIntegral(integral.value * scale, integral.error * scale, integral.evaluations)
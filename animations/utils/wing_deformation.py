@@ -0,0 +1,89 @@
+# animations/utils/wing_deformation.py
+"""
+Bending of the wing mesh by a spanwise deflection field.
+
+A deflection field is a function w(x, t) of the span position x (0 at
+the root) and a parameter t, such as the time or a load factor. Every
+point of the mesh is moved up by w and its section is turned to the
+slope of the deflected span, in one vectorized pass over all points of
+the wing. The batches of the mesh share one point buffer that is
+rewritten in place, so an updater bends the wing every frame without
+creating mobjects or point arrays for them.
+"""
+
+import numpy as np
+
+# Step of the central difference that gives the slope of the deflection
+SLOPE_STEP = 1e-4
+
+def cantilever_deflection(length, tip_deflection, load="uniform"):
+    """
+    Return the deflection field w(x, t) of a cantilever wing fixed at the
+    root, scaled to tip_deflection * t at the tip (t is a load factor).
+    load is "uniform" (distributed lift) or "tip" (a point load at the tip).
+    """
+    if load == "uniform":
+        def shape(x):
+            return x**2 * (6 * length**2 - 4 * length * x + x**2) / (3 * length**4)
+    elif load == "tip":
+        def shape(x):
+            return x**2 * (3 * length - x) / (2 * length**3)
+    else:
+        raise ValueError(f"Unknown load: {load}")
+
+    def deflection(x, t):
+        return tip_deflection * t * shape(x)
+    return deflection
+
+def flapping_deflection(length, tip_amplitude, frequency):
+    """
+    Return the deflection field w(x, t) of a wing flapping in its first
+    bending mode at frequency (Hz), t being the time in seconds.
+    """
+    static = cantilever_deflection(length, tip_amplitude)
+
+    def deflection(x, t):
+        return static(x, np.sin(2 * np.pi * frequency * t))
+    return deflection
+
+class WingBending:
+    """
+    Deform a wing mesh (a VGroup of VMobjects) by a deflection field. The
+    shape of the wing when the bending is created is its rest shape; the
+    wing should not be moved or animated otherwise while it is bent.
+    """
+
+    def __init__(self, wing, deflection):
+        self.wing = wing
+        self.deflection = deflection
+        self.time = 0.0
+
+        self.rest_points = np.concatenate([batch.points for batch in wing])
+        self.points = self.rest_points.copy()
+        lengths = np.array([len(batch.points) for batch in wing])
+        ends = np.cumsum(lengths)
+        # Every batch reads its points from the shared buffer
+        for batch, start, end in zip(wing, ends - lengths, ends):
+            batch.points = self.points[start:end]
+
+        self.span = self.rest_points[:, 0] - self.rest_points[:, 0].min()
+        self.rest_z = self.rest_points[:, 2]
+
+    def apply(self, t):
+        """Bend the wing to the deflection field at parameter t."""
+        w = self.deflection(self.span, t)
+        slope = (self.deflection(self.span + SLOPE_STEP, t) - self.deflection(self.span - SLOPE_STEP, t)) / (2 * SLOPE_STEP)
+        angle = np.arctan(slope)
+
+        # Sections stay perpendicular to the bent span: (x, z) turns by the slope
+        self.points[:, 0] = self.rest_points[:, 0] - self.rest_z * np.sin(angle)
+        self.points[:, 2] = w + self.rest_z * np.cos(angle)
+
+    def update(self, wing, dt):
+        """Updater that advances the time by dt and bends the wing to it."""
+        self.time += dt
+        self.apply(self.time)
+
+    def restore(self):
+        """Return the wing to its rest shape."""
+        self.points[:] = self.rest_points
@@ -0,0 +1,158 @@
+# animations/utils/wing_mesh.py
+"""
+Wing surface meshes and sections built with NumPy.
+
+The wing is an airfoil extruded along the span with a linear taper and a
+sweep. Every vertex of the surface is computed in one broadcast over
+(span station, airfoil point), and the quads between the vertices are
+batched into one VMobject per span strip and surface instead of one
+Polygon per quad. The skin is kept as a compact MeshGeometry (float32
+vertices shared by int32 quads), which is what the geometry cache
+stores and the mesh export writes; the mobjects built from it hold
+float64 points as usual.
+Airfoil sections at any number of span positions are built the same
+way.
+
+Cairo fills each VMobject as a single path with the nonzero winding rule,
+so quads in one batch must not overlap on screen or they would cancel out.
+The upper and lower surfaces overlap whenever the wing is seen from above,
+which is why every span strip is split at the leading edge into two
+batches. Batches are ordered root to tip, so Create still grows the wing
+along the span.
+"""
+
+from manim import BLUE_E, WHITE, YELLOW, YELLOW_E, Polygon, VGroup, VMobject
+import numpy as np
+
+from animations.utils.geometry_cache import cached_geometry
+from animations.utils.mesh_geometry import MeshGeometry, polygon_outline_points
+
+# Style of the wing skin
+WING_STYLE = {
+    "fill_color": BLUE_E,
+    "fill_opacity": 0.8,
+    "stroke_color": WHITE,
+    "stroke_width": 0.5,
+    "stroke_opacity": 0.3,
+}
+
+# Style of the airfoil sections shown along the wing
+SECTION_STYLE = {
+    "fill_color": YELLOW,
+    "fill_opacity": 0.6,
+    "stroke_color": YELLOW_E,
+    "stroke_width": 2,
+}
+
+def section_vertices(airfoil, length, root_chord, tip_chord, sweep_tan, positions):
+    """
+    Return the (span positions, airfoil points, 3) airfoil sections at
+    span positions x. y runs along the chord (centred on mid chord and
+    swept back), z is the thickness; y and z are scaled by the local chord.
+    """
+    airfoil = np.asarray(airfoil, dtype=float)
+    x = np.asarray(positions, dtype=float)[:, None]
+    chord = root_chord + (tip_chord - root_chord) * x / length
+
+    vertices = np.empty((len(x), len(airfoil), 3))
+    vertices[..., 0] = x
+    vertices[..., 1] = (airfoil[:, 0] - 0.5) * chord + x * sweep_tan
+    vertices[..., 2] = airfoil[:, 1] * chord
+    return vertices
+
+def wing_vertices(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments):
+    """
+    Return the (num_span_segments + 1, airfoil points, 3) grid of surface
+    vertices, the sections at evenly spaced span stations.
+    """
+    positions = length * np.linspace(0.0, 1.0, num_span_segments + 1)
+    return section_vertices(airfoil, length, root_chord, tip_chord, sweep_tan, positions)
+
+def wing_faces(num_stations, num_points):
+    """
+    Return the (span segments * airfoil edges, 4) vertex indices of every
+    quad of a (num_stations, num_points) vertex grid, strip by strip, with
+    corners in the order the Polygon wing used.
+    """
+    station = np.arange(num_stations - 1)[:, None] * num_points
+    point = np.arange(num_points - 1)
+    first = (station + point).ravel()
+    return np.stack([first, first + 1, first + num_points + 1, first + num_points], axis=1)
+
+def leading_edge_index(airfoil):
+    """Return the index of the leading edge point of an airfoil that runs TE -> LE -> TE."""
+    return int(np.argmin(np.asarray(airfoil, dtype=float)[:, 0]))
+
+@cached_geometry
+def wing_geometry_arrays(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments):
+    """Return the vertices, faces and batch starts of the wing skin."""
+    vertices = wing_vertices(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments)
+    num_stations, num_points = vertices.shape[:2]
+    faces = wing_faces(num_stations, num_points)
+
+    # Two batches per span strip, split at the leading edge
+    num_edges = num_points - 1
+    strip_starts = np.arange(num_stations - 1)[:, None] * num_edges
+    batch_starts = np.append((strip_starts + [0, leading_edge_index(airfoil)]).ravel(), len(faces))
+    return vertices.reshape(-1, 3).astype(np.float32), faces.astype(np.int32), batch_starts.astype(np.int32)
+
+def wing_geometry(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments):
+    """
+    Return the wing skin as a MeshGeometry with two batches per span strip
+    (upper and lower surface), ordered root to tip.
+    """
+    return MeshGeometry(*wing_geometry_arrays(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments))
+
+def build_wing_mesh(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments):
+    """
+    Build the wing skin as a VGroup of batched VMobjects, two per span
+    strip (upper and lower surface), each holding the quads of that strip
+    as separate subpaths. The geometry is dropped once the points are
+    built, so only the mobject's points stay in memory.
+    """
+    geometry = wing_geometry(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments)
+    return geometry.to_mobject(WING_STYLE)
+
+@cached_geometry
+def section_outlines(airfoil, length, root_chord, tip_chord, sweep_tan, positions):
+    """Return the outline points of the airfoil sections at span positions."""
+    return polygon_outline_points(section_vertices(airfoil, length, root_chord, tip_chord, sweep_tan, positions))
+
+def build_wing_sections(airfoil, length, root_chord, tip_chord, sweep_tan, positions, style=SECTION_STYLE):
+    """
+    Build the airfoil sections at every span position as a VGroup with one
+    VMobject per section, all in the same style.
+    """
+    outlines = section_outlines(airfoil, length, root_chord, tip_chord, sweep_tan, positions)
+    sections = []
+    for outline in outlines:
+        section = VMobject(**style)
+        section.set_points(outline)
+        sections.append(section)
+    return VGroup(*sections)
+
+def build_wing_polygons(airfoil, length, root_chord, tip_chord, sweep_tan, num_span_segments):
+    """
+    Build the wing skin the original way, one Polygon per quad. Kept as
+    the reference that build_wing_mesh is benchmarked and compared against.
+    """
+    wing_surfaces = []
+    for i in range(num_span_segments):
+        span_pos1 = i / num_span_segments
+        span_pos2 = (i + 1) / num_span_segments
+        x1 = length * span_pos1
+        x2 = length * span_pos2
+        chord1 = root_chord * (1 - span_pos1) + tip_chord * span_pos1
+        chord2 = root_chord * (1 - span_pos2) + tip_chord * span_pos2
+        sweep_offset1 = x1 * sweep_tan
+        sweep_offset2 = x2 * sweep_tan
+
+        for j in range(len(airfoil) - 1):
+            chord_pos1, thickness1 = airfoil[j]
+            chord_pos2, thickness2 = airfoil[j + 1]
+            p1 = [x1, (chord_pos1 - 0.5) * chord1 + sweep_offset1, thickness1 * chord1]
+            p2 = [x1, (chord_pos2 - 0.5) * chord1 + sweep_offset1, thickness2 * chord1]
+            p3 = [x2, (chord_pos2 - 0.5) * chord2 + sweep_offset2, thickness2 * chord2]
+            p4 = [x2, (chord_pos1 - 0.5) * chord2 + sweep_offset2, thickness1 * chord2]
+            wing_surfaces.append(Polygon(p1, p2, p3, p4, **WING_STYLE))
+    return VGroup(*wing_surfaces)
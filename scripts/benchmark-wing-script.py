@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# scripts/benchmark_wing.py
+"""
+Script to benchmark the batched wing mesh against the original wing of
+one Polygon per quad, and the batched airfoil sections against one
+Polygon per section.
+
+Both wings are built from the parameters of
+create_wing_from_preset_coordinates(). The script times building each
+wing and rendering it with the 3D camera from the top view and the
+three-quarter view used by the wing scenes. It also reports how far the
+two rendered frames differ, to check that the mesh renders the same.
+Batched builds go through the geometry cache, as they do in a render.
+
+    python3 scripts/benchmark-wing-script.py --repeat 5 --quality -qm --sections 100
+"""
+
+import os
+import sys
+import time
+import argparse
+import importlib
+from types import SimpleNamespace
+
+import numpy as np
+from manim import DEGREES, Polygon, ThreeDCamera, VGroup, tempconfig
+
+from scene_writers import QUALITY_NAMES
+
+# Make the animations package importable from the project root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from animations.utils.wing_mesh import SECTION_STYLE, build_wing_mesh, build_wing_polygons, build_wing_sections, wing_geometry
+
+# Camera orientations of the wing scenes: (name, phi, theta)
+VIEWS = [
+    ("top", 0, -90 * DEGREES),
+    ("three-quarter", 45 * DEGREES, -15 * DEGREES),
+]
+
+def get_wing_args():
+    """Return the build arguments of the wing used in the scenes."""
+    scene_module = importlib.import_module("animations.scenes.beam-bending-scene")
+    holder = SimpleNamespace()
+    scene_module.create_wing_from_preset_coordinates(holder)
+    params = holder.wing_params
+    return (params["naca_coordinates"], params["length"], params["root_chord"],
+            params["tip_chord"], params["sweep_tan"], params["num_span_segments"])
+
+def build_section_polygons(airfoil, length, root_chord, tip_chord, sweep_tan, positions):
+    """Build airfoil sections the original way, point by point and one Polygon each."""
+    sections = []
+    for x_pos in positions:
+        span_pos = x_pos / length
+        local_chord = root_chord * (1 - span_pos) + tip_chord * span_pos
+        sweep_offset = x_pos * sweep_tan
+        points = []
+        for chord_pos, thickness in airfoil:
+            points.append([x_pos, (chord_pos - 0.5) * local_chord + sweep_offset, thickness * local_chord])
+        sections.append(Polygon(*points, **SECTION_STYLE))
+    return VGroup(*sections)
+
+def time_call(func, repeat):
+    """Return the fastest of repeat runs of func in seconds, and its last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def render_frame(wing, phi, theta):
+    """Render a wing with the 3D camera and return the frame's pixels."""
+    camera = ThreeDCamera()
+    camera.set_phi(phi)
+    camera.set_theta(theta)
+    camera.set_zoom(1.5)
+    camera.frame_center = [2, 1.5, 0]
+    camera.capture_mobject(wing)
+    return camera.pixel_array
+
+def run_benchmark(repeat=3, quality="-qm", num_sections=100):
+    """Time building and rendering both wings and compare their frames."""
+    wing_args = get_wing_args()
+    section_args = wing_args[:-1]
+
+    polygon_time, polygon_wing = time_call(lambda: build_wing_polygons(*wing_args), repeat)
+    mesh_time, mesh_wing = time_call(lambda: build_wing_mesh(*wing_args), repeat)
+    print(f"{'':24}{'polygons':>12}{'mesh':>12}{'speedup':>10}")
+    print(f"{'mobjects':24}{len(polygon_wing):>12}{len(mesh_wing):>12}")
+    # The scenes keep the points of every batch and drop the geometry
+    memory = wing_geometry(*wing_args).memory_use()
+    print(f"{'mesh memory':24}{memory['points'] / 1024:>10.0f}kB as points in the scenes, "
+          f"{memory['geometry'] / 1024:.0f}kB as cached geometry")
+    print(f"{'build':24}{polygon_time * 1000:>10.1f}ms{mesh_time * 1000:>10.1f}ms"
+          f"{polygon_time / mesh_time:>9.1f}x")
+
+    for count in sorted({3, num_sections}):
+        positions = np.linspace(0.5, section_args[1] - 0.5, count)
+        polygon_time, _ = time_call(lambda: build_section_polygons(*section_args, positions), repeat)
+        batch_time, _ = time_call(lambda: build_wing_sections(*section_args, positions), repeat)
+        print(f"{f'{count} sections':24}{polygon_time * 1000:>10.1f}ms{batch_time * 1000:>10.1f}ms"
+              f"{polygon_time / batch_time:>9.1f}x")
+
+    with tempconfig({"quality": QUALITY_NAMES[quality]}):
+        for name, phi, theta in VIEWS:
+            polygon_time, polygon_frame = time_call(lambda: render_frame(polygon_wing, phi, theta), repeat)
+            mesh_time, mesh_frame = time_call(lambda: render_frame(mesh_wing, phi, theta), repeat)
+            print(f"{'frame (' + name + ')':24}{polygon_time * 1000:>10.1f}ms{mesh_time * 1000:>10.1f}ms"
+                  f"{polygon_time / mesh_time:>9.1f}x")
+
+            difference = np.abs(polygon_frame.astype(np.int16) - mesh_frame.astype(np.int16))
+            print(f"{'':24}pixel difference: mean {difference.mean():.3f}, max {difference.max()}, "
+                  f"{(difference.max(axis=2) > 16).mean():.2%} of pixels off by more than 16")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the batched wing mesh against the Polygon wing")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="Runs per measurement; the fastest is reported")
+    parser.add_argument("--quality", "-q", default="-qm", choices=sorted(QUALITY_NAMES),
+                        help="Render quality of the frame timings")
+    parser.add_argument("--sections", type=int, default=100, help="Number of airfoil sections to build")
+
+    args = parser.parse_args()
+
+    run_benchmark(args.repeat, args.quality, args.sections)
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,37 @@ demonstration video with appropriate transitions.
 """
 
 import os
+import sys
+import math
+import time
 import argparse
 import subprocess
-import glob
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from encoder_settings import DELIVERY_PRESETS, INTERMEDIATE_EXTENSION, get_fragment_codec_args
+from media_index import load_video_index, latest_render
+from media_probe import probe_duration, probe_frame_rate, probe_keyframes
+from render_manifest import load_manifest, record_outputs
+from video_sequence import format_time, parse_time, read_timeline
+
+# Output modes supported by combine_videos
+OUTPUT_FORMATS = ["mp4", "hls", "dash"]
+
+# Cuts closer than this to a keyframe (in seconds) are treated as on it
+KEYFRAME_TOLERANCE = 0.005
+
+# Encoder settings for the lower renditions of the ladder
+LADDER_ENCODER_ARGS = [
+    "-c:v", "libx264",
+    "-preset", "medium",
+    "-crf", "20",
+    "-pix_fmt", "yuv420p",
+    "-movflags", "+faststart"
+]
+
 def find_media_dir():
     """Find the media directory created by Manim."""
     possible_dirs = ["media", "output"]
@@ -22,66 +48,440 @@ def find_media_dir():
 def get_video_files(quality="720p30"):
     """Get all rendered video files in the specified quality."""
     media_dir = find_media_dir()
+    index = load_video_index(media_dir)
     
     # Typical Manim output path structure
     videos_dir = os.path.join(media_dir, "videos")
-    
-    print(f"Looking for videos in {videos_dir}")
-    # If using default Manim structure
     if os.path.isdir(videos_dir):
-        # Find all scene directories
-        scene_dirs = [d for d in os.listdir(videos_dir) if os.path.isdir(os.path.join(videos_dir, d))]
-        print(f"Found {len(scene_dirs)} scene directories")
-        video_files = []
-        
-        for scene_dir in scene_dirs:
-            # Look for videos in the quality folder
-            quality_dir = os.path.join(videos_dir, scene_dir, quality)
-            print(f"Looking for videos in {quality_dir}")
-            if os.path.isdir(quality_dir):
-                print(f"Found {len(os.listdir(quality_dir))} video files")
-                video_files.extend(glob.glob(os.path.join(quality_dir, "*.mp4")))
+        print(f"Found {len(index)} scene directories in {videos_dir}")
+        clip_maps = [qualities.get(quality, {}) for qualities in index.values()]
     else:
-        # If using a flattened output structure
-        video_files = glob.glob(os.path.join(media_dir, "**/*.mp4"), recursive=True)
+        # If using a flattened output structure, every clip is used
+        clip_maps = list(index[""].values())
     
+    video_files = sorted(latest_render(files) for clips in clip_maps for files in clips.values())
+    print(f"Found {len(video_files)} {quality} video files")
     return video_files
 
-def create_file_list(video_files, sequence_file=None):
+def order_video_files(video_files, sequence_file=None):
     """
-    Create a file list for ffmpeg to use with the concat demuxer.
-    If a sequence file is provided, use it to order the videos.
-    """
-    # Create temporary file list
-    list_file = "video_list.txt"
-    
-    # If a sequence file is provided, use it to order the videos
-    if sequence_file and os.path.exists(sequence_file):
-        ordered_files = []
-        with open(sequence_file, 'r') as f:
-            for line in f:
-                scene_name = line.strip()
-                if scene_name and not scene_name.startswith('#'):
-                    # Find matching video file
-                    matches = [f for f in video_files if scene_name.lower() in Path(f).stem.lower()]
-                    if matches:
-                        ordered_files.extend(matches)
-        
-        # Add any remaining files not specified in the sequence
-        remaining = [f for f in video_files if f not in ordered_files]
-        ordered_files.extend(remaining)
-        
-        video_files = ordered_files
+    Order the video files using a sequence file if one is provided.
+    Returns (video_file, start, end, section) clips, where start and end
+    are the trim points from the sequence file or None when the clip is
+    not trimmed, and section is the sequence section it belongs to.
+    Files not named in the sequence are appended at the end.
+    """
+    if not sequence_file or not os.path.exists(sequence_file):
+        return [(video_file, None, None, None) for video_file in video_files]
+
+    clips = []
+    for entry in read_timeline(sequence_file):
+        # Find matching video file
+        matches = [f for f in video_files if entry.name.lower() in Path(f).stem.lower()]
+        clips.extend((match, entry.start, entry.end, entry.section) for match in matches)
     
+    # Add any remaining files not specified in the sequence
+    ordered_files = [clip[0] for clip in clips]
+    remaining = [f for f in video_files if f not in ordered_files]
+    clips.extend((f, None, None, None) for f in remaining)
+    
+    return clips
+
+def create_file_list(pieces, list_file="video_list.txt"):
+    """
+    Create a file list for ffmpeg to use with the concat demuxer.
+    Each piece is a (video_file, inpoint, outpoint, duration) tuple; None
+    means the piece starts or ends with the file.
+    """
     # Write file list
     with open(list_file, 'w') as f:
-        for video_file in video_files:
+        for video_file, inpoint, outpoint, duration in pieces:
             f.write(f"file '{os.path.abspath(video_file)}'\n")
+            if inpoint is not None:
+                f.write(f"inpoint {inpoint:.6f}\n")
+            if outpoint is not None:
+                f.write(f"outpoint {outpoint:.6f}\n")
+            if duration is not None:
+                f.write(f"duration {duration:.6f}\n")
     
     return list_file
 
-def combine_videos(output_file="teaching_demo.mp4", sequence_file=None, quality="720p30"):
-    """Combine all videos into a single file using ffmpeg."""
+def encode_fragment(video_file, start, end, fragment_file):
+    """Re-encode the frames of video_file between start and end seconds."""
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss", f"{start:.6f}",
+        "-i", video_file,
+        "-t", f"{end - start:.6f}",
+        "-map", "0",
+        # Match the settings the clip was encoded with (Manim's libx264
+        # defaults, or FFV1 for intermediates) so the fragment can be
+        # concatenated with stream-copied parts of the same clip at the
+        # same quality
+        *get_fragment_codec_args(video_file),
+        "-c:a", "aac",
+        fragment_file
+    ]
+    subprocess.run(cmd, check=True)
+
+def resolve_trim_points(start, end, duration):
+    """Turn in/out points (None or negative allowed) into times inside the clip."""
+    start = 0.0 if start is None else (start if start >= 0 else duration + start)
+    end = duration if end is None else (end if end >= 0 else duration + end)
+    return max(0.0, start), min(duration, end)
+
+def trim_clip(video_file, start, end, work_dir):
+    """
+    Cut a clip down to its in/out points.
+    The range between the first and last keyframes inside the cut is
+    stream-copied using concat inpoint/outpoint directives, so a cut that
+    lands on keyframes costs no encoding at all. Only the partial GOPs
+    before the first and after the last of those keyframes are re-encoded.
+    Returns the concat pieces for the clip and its trimmed duration.
+    """
+    duration = probe_duration(video_file)
+    start, end = resolve_trim_points(start, end, duration)
+    if end - start <= KEYFRAME_TOLERANCE:
+        raise ValueError(f"Trim points of {video_file} leave an empty clip")
+    
+    keyframes, decode_delay = probe_keyframes(video_file)
+    inside = [k for k in keyframes if start - KEYFRAME_TOLERANCE <= k <= end + KEYFRAME_TOLERANCE]
+    
+    copy_start = inside[0] if inside else end
+    if end >= duration - KEYFRAME_TOLERANCE:
+        copy_end = duration
+    else:
+        copy_end = inside[-1] if inside else end
+    
+    stem, extension = Path(video_file).stem, Path(video_file).suffix
+    pieces = []
+    if copy_end - copy_start <= KEYFRAME_TOLERANCE:
+        # Both cuts fall inside the same GOP, so there is nothing to copy
+        fragment_file = os.path.join(work_dir, f"{stem}_{start:.3f}_{end:.3f}{extension}")
+        encode_fragment(video_file, start, end, fragment_file)
+        return [(fragment_file, None, None, None)], end - start
+    
+    if copy_start - start > KEYFRAME_TOLERANCE:
+        head_file = os.path.join(work_dir, f"{stem}_head_{start:.3f}{extension}")
+        encode_fragment(video_file, start, copy_start, head_file)
+        pieces.append((head_file, None, None, None))
+    
+    # The concat demuxer compares outpoint against decode timestamps, so
+    # shift it by the decode delay to stop exactly before the keyframe,
+    # and give the real duration so the next piece is offset correctly
+    inpoint = copy_start if copy_start > KEYFRAME_TOLERANCE else None
+    if copy_end < duration:
+        pieces.append((video_file, inpoint, copy_end - decode_delay, copy_end - copy_start))
+    else:
+        pieces.append((video_file, inpoint, None, None))
+    
+    if end - copy_end > KEYFRAME_TOLERANCE:
+        tail_file = os.path.join(work_dir, f"{stem}_tail_{end:.3f}{extension}")
+        encode_fragment(video_file, copy_end, end, tail_file)
+        pieces.append((tail_file, None, None, None))
+    
+    return pieces, end - start
+
+def prepare_clips(clips, work_dir):
+    """
+    Turn ordered clips into concat pieces, trimming the clips that have
+    in/out points. Returns the pieces and the duration of each clip,
+    which is None for untrimmed clips.
+    """
+    pieces = []
+    clip_durations = []
+    for video_file, start, end, _ in clips:
+        if start is None and end is None:
+            pieces.append((video_file, None, None, None))
+            clip_durations.append(None)
+        else:
+            print(f"Trimming {video_file}")
+            clip_pieces, duration = trim_clip(video_file, start, end, work_dir)
+            pieces.extend(clip_pieces)
+            clip_durations.append(duration)
+    return pieces, clip_durations
+
+def get_recorded_durations(media_dir):
+    """
+    Return the durations of scene clips recorded in the render manifest,
+    by absolute path. Clips written after their entry, for example by a
+    later render through the Manim CLI, are left out.
+    """
+    durations = {}
+    for entry in load_manifest(media_dir)["scenes"].values():
+        video_file = entry.get("file")
+        if not video_file or "duration" not in entry or not os.path.exists(video_file):
+            continue
+        rendered = time.mktime(time.strptime(entry["rendered"], "%Y-%m-%dT%H:%M:%S"))
+        if os.path.getmtime(video_file) <= rendered + 1:
+            durations[os.path.abspath(video_file)] = entry["duration"]
+    return durations
+
+def check_budget(clips, budget, media_dir):
+    """
+    Print the length of every section and scene of the combined video and
+    return whether it fits in budget seconds. Durations come from the
+    render manifest, or from container headers for clips it does not
+    know; nothing is decoded, so this runs before any muxing or encoding.
+    """
+    recorded = get_recorded_durations(media_dir)
+    sections = {}
+    for video_file, start, end, section in clips:
+        duration = recorded.get(os.path.abspath(video_file))
+        if duration is None:
+            duration = probe_duration(video_file)
+        start, end = resolve_trim_points(start, end, duration)
+        sections.setdefault(section or "Not in sequence", []).append((Path(video_file).stem, end - start))
+    
+    total = 0.0
+    print(f"Duration budget {format_time(budget)}")
+    for section, scenes in sections.items():
+        section_total = sum(duration for _, duration in scenes)
+        total += section_total
+        print(f"  {section:<44} {format_time(section_total):>8}")
+        for scene, duration in scenes:
+            print(f"    {scene:<42} {format_time(duration):>8}")
+    
+    difference = total - budget
+    status = f"over by {format_time(difference)}" if difference > 0 else f"{format_time(-difference)} to spare"
+    print(f"  {'Total':<44} {format_time(total):>8}  ({status})")
+    return difference <= 0
+
+def get_scene_durations(video_files, clip_durations):
+    """Return the duration of every clip, probing the untrimmed ones."""
+    return [
+        probe_duration(video_file) if duration is None else duration
+        for video_file, duration in zip(video_files, clip_durations)
+    ]
+
+def get_scene_starts(scene_durations):
+    """Return the time each scene starts at in the combined video."""
+    return [sum(scene_durations[:i]) for i in range(len(scene_durations))]
+
+def get_segment_times(scene_durations, segment_duration):
+    """
+    Compute split points for segmented output.
+    Every scene boundary is a split point, and scenes longer than
+    segment_duration are subdivided into equal pieces so no segment is
+    much longer than requested. Stream copy can only cut on keyframes, so
+    ffmpeg splits at the first keyframe at or after each time; scene
+    boundaries always start on a keyframe and are therefore exact.
+    """
+    if segment_duration <= 0:
+        raise ValueError(f"Segment duration must be positive, got {segment_duration}")
+    segment_times = []
+    scene_start = 0.0
+    for duration in scene_durations:
+        pieces = max(1, math.ceil(duration / segment_duration))
+        step = duration / pieces
+        segment_times.extend(scene_start + step * i for i in range(pieces))
+        scene_start += duration
+    
+    # The first split point is the start of the stream
+    return segment_times[1:]
+
+def get_segmented_output_args(output_file, output_format, segment_times, segment_duration):
+    """
+    Build the ffmpeg output arguments for HLS or DASH packaging.
+    Segments and the playlist are written to a directory named after
+    the output file. Returns the arguments and the playlist path.
+    """
+    output_dir = Path(output_file).with_suffix("")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    if output_format == "hls":
+        # The segment muxer accepts explicit split points, which lets us
+        # put a segment boundary on every scene boundary
+        playlist = output_dir / "playlist.m3u8"
+        args = [
+            "-f", "segment",
+            "-segment_format", "mpegts",
+            "-segment_list", str(playlist),
+            "-segment_list_type", "m3u8",
+            # Accept keyframes a hair before a split point so rounding
+            # does not push a scene boundary to the next keyframe
+            "-segment_time_delta", str(KEYFRAME_TOLERANCE),
+        ]
+        if segment_times:
+            args += ["-segment_times", ",".join(f"{t:.3f}" for t in segment_times)]
+        else:
+            args += ["-segment_time", str(segment_duration)]
+        args.append(str(output_dir / "segment_%03d.ts"))
+    else:
+        # The DASH muxer cuts on the first keyframe after each target
+        # duration; scene starts are keyframes, so most cuts line up
+        playlist = output_dir / "manifest.mpd"
+        args = [
+            "-f", "dash",
+            "-seg_duration", str(segment_duration),
+            "-use_template", "1",
+            "-use_timeline", "1",
+            "-init_seg_name", "init-$RepresentationID$.m4s",
+            "-media_seg_name", "chunk-$RepresentationID$-$Number%05d$.m4s",
+            str(playlist)
+        ]
+    
+    return args, playlist
+
+def get_rendition_file(output_file, height):
+    """Return the file name of the rendition of output_file at a given height."""
+    output_path = Path(output_file)
+    return str(output_path.with_name(f"{output_path.stem}_{height}p.mp4"))
+
+def get_duration_args(duration):
+    """Return the output option that stops an output after duration seconds, if any."""
+    return [] if duration is None else ["-t", f"{duration:.6f}"]
+
+def get_ladder_output_args(output_file, ladder, encoder_args=LADDER_ENCODER_ARGS, duration=None):
+    """
+    Build ffmpeg arguments that encode several lower renditions of the
+    concatenated input. The input is decoded once and fanned out with a
+    split filter, so each extra rendition only costs a scale and an encode.
+    With a duration, each rendition stops after that many seconds.
+    Returns the arguments and the list of rendition files.
+    """
+    labels = [f"r{i}" for i in range(len(ladder))]
+    graph = f"[0:v]split={len(ladder)}" + "".join(f"[{label}]" for label in labels)
+    for label, height in zip(labels, ladder):
+        graph += f";[{label}]scale=-2:{height}:flags=lanczos[v{height}]"
+
+    args = ["-filter_complex", graph]
+    rendition_files = []
+    for height in ladder:
+        rendition_file = get_rendition_file(output_file, height)
+        args += ["-map", f"[v{height}]", "-map", "0:a?", "-c:a", "copy"]
+        args += encoder_args + get_duration_args(duration) + [rendition_file]
+        rendition_files.append(rendition_file)
+
+    return args, rendition_files
+
+def get_encode_args(preset, keyframe_times):
+    """
+    Build the arguments for the one lossy encode into the delivery format.
+    Keyframes are forced at keyframe_times so scenes and segments still
+    start on a keyframe after re-encoding.
+    """
+    args = DELIVERY_PRESETS[preset] + ["-c:a", "aac"]
+    if keyframe_times:
+        args += ["-force_key_frames", ",".join(f"{t:.6f}" for t in keyframe_times)]
+    return args
+
+def get_chunk_bounds(scene_durations, chunk_duration, frame_rate):
+    """
+    Split the combined video into chunks for parallel encoding.
+    Chunks break at every scene boundary and long scenes are split into
+    chunks of about chunk_duration. Boundaries are rounded to whole frames
+    so every frame lands in exactly one chunk. Returns (start, end) pairs;
+    the last chunk's end is None and runs to the end of the input.
+    """
+    times = [0.0] + get_segment_times(scene_durations, chunk_duration)
+    frames = sorted({round(t * frame_rate) for t in times})
+    starts = [frame / frame_rate for frame in frames]
+    return list(zip(starts, starts[1:] + [None]))
+
+def get_chunk_duration(start, end):
+    """Return the length of a chunk in seconds, or None for the last chunk."""
+    return None if end is None else end - start
+
+def encode_chunk(joined_file, start, end, chunk_file, encoder_args, ladder_args):
+    """
+    Encode the part of the joined input between start and end seconds.
+    The length is given to every output, and ladder_args must stop each
+    rendition at the same length, so the chunk and its renditions have
+    the same frames.
+    """
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-loglevel", "error",
+        "-ss", f"{start:.6f}",
+        "-i", joined_file
+    ]
+    cmd += encoder_args + get_duration_args(get_chunk_duration(start, end)) + [chunk_file] + ladder_args
+    subprocess.run(cmd, check=True)
+    print(f"Encoded {chunk_file}")
+
+def encode_in_chunks(list_file, chunk_bounds, work_dir, preset, keyframe_times, ladder, jobs):
+    """
+    Encode the concatenated input as independent chunks, jobs at a time.
+    Every chunk uses the same encoder settings and starts with an IDR
+    frame of a closed GOP, so the chunks can be joined by stream copy.
+    Returns the chunk files and, for each ladder height, its chunk files.
+    """
+    # The concat demuxer cannot always seek (it then starts at the first
+    # frame of the clip instead of the chunk), so the pieces are joined
+    # by stream copy first and the chunks are cut from the joined file.
+    # .mov holds both the x264 clips and the FFV1 intermediates.
+    joined_file = os.path.join(work_dir, "joined.mov")
+    join_file_list(list_file, joined_file)
+
+    # Split the machine between the encoders running at once
+    threads = max(1, (os.cpu_count() or 1) // jobs)
+    chunk_files = []
+    rendition_chunks = [[] for _ in ladder or []]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = []
+        for i, (start, end) in enumerate(chunk_bounds):
+            chunk_file = os.path.join(work_dir, f"chunk_{i:04d}.mp4")
+            chunk_keyframes = [
+                t - start for t in keyframe_times
+                if t - start > KEYFRAME_TOLERANCE and (end is None or end - t > KEYFRAME_TOLERANCE)
+            ]
+            encoder_args = get_encode_args(preset, chunk_keyframes)
+            encoder_args += ["-threads", str(threads), "-x264-params", "open-gop=0"]
+            ladder_args = []
+            if ladder:
+                ladder_args, rendition_files = get_ladder_output_args(
+                    chunk_file, ladder,
+                    DELIVERY_PRESETS[preset] + ["-threads", str(threads), "-x264-params", "open-gop=0"],
+                    get_chunk_duration(start, end)
+                )
+                for files, rendition_file in zip(rendition_chunks, rendition_files):
+                    files.append(rendition_file)
+            futures.append(pool.submit(
+                encode_chunk, joined_file, start, end, chunk_file, encoder_args, ladder_args
+            ))
+            chunk_files.append(chunk_file)
+        
+        # Raise the first failure, if any
+        for future in futures:
+            future.result()
+    
+    return chunk_files, rendition_chunks
+
+def concat_files(video_files, output_file, list_file):
+    """Join whole video files into one by stream copy."""
+    create_file_list([(f, None, None, None) for f in video_files], list_file)
+    join_file_list(list_file, output_file)
+
+def join_file_list(list_file, output_file):
+    """Join the pieces of a concat file list into one file by stream copy."""
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", list_file,
+        "-c", "copy",
+        "-movflags", "+faststart",
+        output_file
+    ]
+    subprocess.run(cmd, check=True)
+
+def combine_videos(output_file="teaching_demo.mp4", sequence_file=None, quality="720p30",
+                   output_format="mp4", segment_duration=4.0, ladder=None, preset=None,
+                   jobs=1, chunk_duration=10.0, budget=None):
+    """
+    Combine all videos into a single file using ffmpeg.
+    Without a preset the clips are joined by stream copy. With a preset
+    they are encoded once into the delivery format; lossless intermediate
+    clips cannot be delivered as they are, so they always get the
+    release preset unless another is given. With more than one job the
+    encode is split into chunks that are encoded in parallel.
+    With a budget in seconds, nothing is written if the clips are longer;
+    False is returned in that case.
+    """
     video_files = get_video_files(quality)
     
     if not video_files:
@@ -90,8 +490,54 @@ def combine_videos(output_file="teaching_demo.mp4", sequence_file=None, quality=
     
     print(f"Found {len(video_files)} video files to combine")
     
+    # Order the clips and apply any trim points from the sequence file
+    clips = order_video_files(video_files, sequence_file)
+    video_files = [clip[0] for clip in clips]
+    if budget is not None and not check_budget(clips, budget, find_media_dir()):
+        print("Error: the combined video would exceed the duration budget")
+        return False
+    
+    if preset is None and any(f.endswith(INTERMEDIATE_EXTENSION) for f in video_files):
+        print("Found lossless intermediate clips, encoding with the release preset")
+        preset = "release"
+    
+    work_dir = tempfile.mkdtemp(prefix="combine_", dir=".")
+    try:
+        pieces, clip_durations = prepare_clips(clips, work_dir)
+    except (subprocess.CalledProcessError, ValueError) as e:
+        print(f"Error trimming videos: {e}")
+        shutil.rmtree(work_dir)
+        return
+    
     # Create file list
-    list_file = create_file_list(video_files, sequence_file)
+    list_file = create_file_list(pieces)
+    
+    # Durations come from the container headers, so this is cheap
+    scene_durations = get_scene_durations(video_files, clip_durations)
+    scene_starts = get_scene_starts(scene_durations)
+    segment_times = get_segment_times(scene_durations, segment_duration)
+    keyframe_times = segment_times if output_format != "mp4" else scene_starts[1:]
+    
+    # Encode chunks in parallel, then mux them by stream copy below
+    chunked = bool(preset) and jobs > 1
+    if chunked:
+        chunk_bounds = get_chunk_bounds(
+            scene_durations, chunk_duration, probe_frame_rate(video_files[0])
+        )
+        print(f"Encoding {len(chunk_bounds)} chunks with {jobs} parallel jobs")
+        try:
+            chunk_files, rendition_chunks = encode_in_chunks(
+                list_file, chunk_bounds, work_dir, preset, keyframe_times, ladder, jobs
+            )
+            for height, files in zip(ladder or [], rendition_chunks):
+                concat_files(files, get_rendition_file(output_file, height),
+                             os.path.join(work_dir, f"rendition_{height}p.txt"))
+        except subprocess.CalledProcessError as e:
+            print(f"Error encoding chunks: {e}")
+            os.remove(list_file)
+            shutil.rmtree(work_dir)
+            return
+        create_file_list([(f, None, None, None) for f in chunk_files], list_file)
     
     # Combine videos using ffmpeg
     cmd = [
@@ -99,29 +545,90 @@ def combine_videos(output_file="teaching_demo.mp4", sequence_file=None, quality=
         "-y",  # Overwrite output file if it exists
         "-f", "concat", 
         "-safe", "0", 
-        "-i", list_file, 
-        "-c", "copy",
-        output_file
+        "-i", list_file
     ]
+    if preset and not chunked:
+        cmd += get_encode_args(preset, keyframe_times)
+    else:
+        cmd += ["-c", "copy"]
+    
+    if output_format == "mp4":
+        if preset:
+            cmd += ["-movflags", "+faststart"]
+        cmd.append(output_file)
+        outputs = [{"path": output_file, "kind": output_format, "rendition": "source"}]
+    else:
+        output_args, playlist = get_segmented_output_args(
+            output_file, output_format, segment_times, segment_duration
+        )
+        cmd += ["-map", "0"] + output_args
+        outputs = [{"path": playlist, "kind": output_format, "rendition": "source"}]
+    if preset:
+        outputs[0]["preset"] = preset
+    
+    # Lower renditions are extra outputs of the same ffmpeg process
+    if ladder:
+        ladder_encoder_args = LADDER_ENCODER_ARGS
+        if preset:
+            ladder_encoder_args = DELIVERY_PRESETS[preset] + ["-movflags", "+faststart"]
+        ladder_args, rendition_files = get_ladder_output_args(output_file, ladder, ladder_encoder_args)
+        if not chunked:
+            cmd += ladder_args
+        for height, rendition_file in zip(ladder, rendition_files):
+            outputs.append({"path": rendition_file, "kind": "mp4", "rendition": f"{height}p"})
+    
+    # Every rendition shares the timeline of scenes
+    chapters = [
+        {"scene": Path(f).stem, "file": f, "start": round(start, 6), "duration": round(duration, 6)}
+        for f, start, duration in zip(video_files, scene_starts, scene_durations)
+    ]
+    for output in outputs:
+        output["chapters"] = chapters
     
     try:
         subprocess.run(cmd, check=True)
-        print(f"Successfully combined videos into {output_file}")
+        print(f"Successfully combined videos into {', '.join(str(o['path']) for o in outputs)}")
+        record_outputs(outputs, find_media_dir())
     except subprocess.CalledProcessError as e:
         print(f"Error combining videos: {e}")
     
-    # Clean up temporary file
+    # Clean up temporary files
     os.remove(list_file)
+    shutil.rmtree(work_dir)
 
 def main():
     parser = argparse.ArgumentParser(description="Combine animation clips into final video")
     parser.add_argument("--output", "-o", default="teaching_demo.mp4", help="Output file name")
     parser.add_argument("--sequence", "-s", help="File containing the sequence of scenes to include")
     parser.add_argument("--quality", "-q", default="720p30", help="Video quality folder to use")
+    parser.add_argument("--format", "-f", default="mp4", choices=OUTPUT_FORMATS,
+                        help="Output a single mp4, or HLS/DASH segments with a playlist")
+    parser.add_argument("--segment-duration", type=float, default=4.0,
+                        help="Target segment length in seconds for HLS/DASH output")
+    parser.add_argument("--ladder", type=lambda s: [int(h) for h in s.split(",")],
+                        help="Comma-separated heights of extra renditions, e.g. 1080,720")
+    parser.add_argument("--preset", choices=sorted(DELIVERY_PRESETS),
+                        help="Re-encode once with these settings instead of stream copying (draft or release)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of chunks to encode in parallel when re-encoding")
+    parser.add_argument("--chunk-duration", type=float, default=10.0,
+                        help="Target chunk length in seconds for parallel encoding")
+    parser.add_argument("--budget", type=parse_time,
+                        help="Maximum length in seconds or minutes:seconds, e.g. 10:00; checked before muxing")
     
     args = parser.parse_args()
-    
-    combine_videos(args.output, args.sequence, args.quality)
+    if args.segment_duration <= 0:
+        parser.error("--segment-duration must be a positive number of seconds")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.chunk_duration <= 0:
+        parser.error("--chunk-duration must be a positive number of seconds")
+
+    result = combine_videos(args.output, args.sequence, args.quality, args.format,
+                            args.segment_duration, args.ladder, args.preset,
+                            args.jobs, args.chunk_duration, args.budget)
+    if result is False:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
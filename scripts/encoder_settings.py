@@ -0,0 +1,47 @@
+# scripts/encoder_settings.py
+"""
+Encoder settings shared by the render and combine scripts, so clips
+written by one can be stream-copied or re-encoded by the other.
+"""
+
+# Lossless intermediate for scene clips. Every frame is a keyframe, so
+# clips can be cut anywhere by stream copy. Manim only accepts .mp4, .mov
+# and .webm for its movie files, and of these only .mov can hold FFV1.
+INTERMEDIATE_EXTENSION = ".mov"
+INTERMEDIATE_CODEC_ARGS = [
+    "-c:v", "ffv1",
+    "-level", "3",
+    "-g", "1",
+    "-slices", "16",
+    "-pix_fmt", "bgr0"
+]
+
+# The settings Manim 0.17 encodes its own scene clips with: libx264 at
+# its default rate control (crf 23, preset medium), no tuning
+MANIM_CODEC_ARGS = [
+    "-c:v", "libx264",
+    "-pix_fmt", "yuv420p"
+]
+
+# Settings for the single lossy encode into the delivery format
+DELIVERY_PRESETS = {
+    "draft": [
+        "-c:v", "libx264",
+        "-preset", "ultrafast",
+        "-crf", "23",
+        "-pix_fmt", "yuv420p"
+    ],
+    "release": [
+        "-c:v", "libx264",
+        "-preset", "slow",
+        "-tune", "animation",
+        "-crf", "18",
+        "-pix_fmt", "yuv420p"
+    ],
+}
+
+def get_fragment_codec_args(video_file):
+    """Return encoder arguments that match how a scene clip was encoded."""
+    if str(video_file).endswith(INTERMEDIATE_EXTENSION):
+        return INTERMEDIATE_CODEC_ARGS
+    return MANIM_CODEC_ARGS
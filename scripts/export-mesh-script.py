@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# scripts/export_mesh.py
+"""
+Script to export the procedural 3D geometry of the scenes as binary
+glTF (.glb) or OBJ, so it can be opened in other tools or generated once
+and loaded at render time with animations.utils.mesh_io.load_mesh.
+
+The wing is built by create_wing_from_preset_coordinates(); the prism
+and cylinder are the beams of the second moment of area scene. Meshes
+are built at the level of detail of the given render quality.
+
+    python3 scripts/export-mesh-script.py wing media/meshes/wing.glb --quality -qh
+"""
+
+import os
+import sys
+import argparse
+import importlib
+from types import SimpleNamespace
+
+import numpy as np
+from manim import Cylinder, Prism, tempconfig
+
+from scene_writers import QUALITY_NAMES
+
+# Make the animations package importable from the project root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from animations.utils.lod import lod_samples
+from animations.utils.mesh_io import save_mesh
+from animations.utils.wing_mesh import wing_geometry
+
+def build_wing():
+    """Build the geometry of the wing used in the scenes."""
+    scene_module = importlib.import_module("animations.scenes.beam-bending-scene")
+    holder = SimpleNamespace()
+    scene_module.create_wing_from_preset_coordinates(holder)
+    params = holder.wing_params
+    return wing_geometry(params["naca_coordinates"], params["length"], params["root_chord"],
+                         params["tip_chord"], params["sweep_tan"], params["num_span_segments"])
+
+def build_prism():
+    """Build the square beam of the second moment of area scene."""
+    side_length = 0.5 * np.sqrt(np.pi)
+    return Prism(dimensions=[6, side_length, side_length])
+
+def build_cylinder():
+    """Build the circular beam of the second moment of area scene."""
+    resolution = lod_samples("cylinder_resolution")
+    return Cylinder(radius=0.5, height=6, direction=np.array([1.0, 0., 0.]), resolution=(resolution, resolution))
+
+SHAPES = {
+    "wing": build_wing,
+    "prism": build_prism,
+    "cylinder": build_cylinder,
+}
+
+def export_mesh(shape, output, quality="-qh"):
+    """Build a shape at the level of detail of quality and save it to output."""
+    with tempconfig({"quality": QUALITY_NAMES[quality]}):
+        geometry = SHAPES[shape]()
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    mesh = save_mesh(geometry, output)
+    faces = sum(len(batch) for batch in mesh.faces)
+    print(f"Saved {shape} to {output}: {len(mesh.vertices)} vertices, {faces} faces in {len(mesh.faces)} batches")
+
+def main():
+    parser = argparse.ArgumentParser(description="Export procedural scene geometry as glTF or OBJ")
+    parser.add_argument("shape", choices=sorted(SHAPES), help="Geometry to export")
+    parser.add_argument("output", help="Output file, .glb or .obj")
+    parser.add_argument("--quality", "-q", default="-qh", choices=sorted(QUALITY_NAMES),
+                        help="Render quality whose level of detail the mesh is built at")
+
+    args = parser.parse_args()
+
+    export_mesh(args.shape, args.output, args.quality)
+
+if __name__ == "__main__":
+    main()
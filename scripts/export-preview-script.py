@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# scripts/export_preview.py
+"""
+Script to export short looping previews of scenes as animated GIF or
+WebP, downscaled for slides and the LMS.
+
+Each preview is given as SCENE, SCENE:START-END (seconds or
+minutes:seconds) or SCENE:play=N, where N counts the play() and wait()
+calls recorded for the scene in the render manifest:
+
+    python3 scripts/export-preview-script.py BeamCurvatureScene:play=5 BeamDistributedLoadScene:0:12-0:18
+
+GIF palettes are generated once per scene clip and size and cached in
+media/palettes, so re-exporting another range of a scene skips the
+palette pass.
+"""
+
+import os
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from media_index import latest_render, load_video_index
+from render_manifest import load_manifest, record_outputs
+from video_sequence import parse_time
+
+# Preview formats and their file extensions
+PREVIEW_FORMATS = {"gif": ".gif", "webp": ".webp"}
+
+PALETTE_DIR = "palettes"
+
+def find_scene_clip(scene_name, media_dir, quality):
+    """
+    Return the clip of a scene and its manifest entry (or None).
+    Scenes rendered through the render script are looked up in the
+    manifest; otherwise the clip is found in the media index.
+    """
+    for name, entry in load_manifest(media_dir)["scenes"].items():
+        if name.lower() == scene_name.lower() and os.path.exists(entry["file"]):
+            return entry["file"], entry
+
+    for qualities in load_video_index(media_dir).values():
+        for clip_name, files in qualities.get(quality, {}).items():
+            if clip_name.lower() == scene_name.lower():
+                return latest_render(files), None
+    raise FileNotFoundError(f"No rendered clip found for {scene_name}")
+
+def parse_preview(spec, media_dir, quality):
+    """
+    Turn a preview spec into (scene, clip, start, end); start and end are
+    None for the whole clip.
+    """
+    scene_name, _, time_range = spec.partition(":")
+    clip, entry = find_scene_clip(scene_name, media_dir, quality)
+    if not time_range:
+        return scene_name, clip, None, None
+
+    if time_range.startswith("play="):
+        if entry is None or "plays" not in entry:
+            raise ValueError(f"{scene_name} has no recorded plays; render it with render-all-script.py --keyframes")
+        number = time_range[len("play="):]
+        plays = entry["plays"]
+        if not number.isdigit() or not 1 <= int(number) <= len(plays):
+            raise ValueError(f"{scene_name} has plays 1 to {len(plays)}, not play={number}")
+        play = plays[int(number) - 1]
+        return scene_name, clip, play["start"], play["start"] + play["duration"]
+
+    # Times may contain ':' themselves, so split the range on its last '-'
+    start, _, end = time_range.rpartition("-")
+    return scene_name, clip, parse_time(start), parse_time(end)
+
+def get_palette_file(clip, width, media_dir):
+    """
+    Return the cache path of the palette for a clip at a given width.
+    The key includes the clip's size and mtime, so a re-rendered clip
+    gets a new palette.
+    """
+    stat = os.stat(clip)
+    key = f"{os.path.abspath(clip)}:{stat.st_size}:{stat.st_mtime_ns}:{width}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return os.path.join(media_dir, PALETTE_DIR, f"{Path(clip).stem}_{width}_{digest}.png")
+
+def generate_palette(clip, width, palette_file):
+    """
+    Build a 256-colour palette for a whole clip, so every range of the
+    scene can share it. Only keyframes are decoded: Manim scenes reuse a
+    handful of flat colours, which the keyframes already show.
+    """
+    os.makedirs(os.path.dirname(palette_file), exist_ok=True)
+    temp_file = f"{palette_file}.{os.getpid()}.png"
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-loglevel", "error",
+        "-skip_frame", "nokey",
+        "-i", clip,
+        "-vf", f"scale={width}:-2:flags=lanczos,palettegen=stats_mode=full",
+        "-frames:v", "1",
+        "-update", "1",
+        temp_file
+    ]
+    subprocess.run(cmd, check=True)
+    os.replace(temp_file, palette_file)
+    print(f"Generated palette {palette_file}")
+
+def export_preview(clip, start, end, output_file, preview_format, width, fps, palette_file=None):
+    """Export part of a clip as a looping GIF or WebP."""
+    cmd = ["ffmpeg", "-y", "-loglevel", "error"]
+    if start is not None:
+        cmd += ["-ss", f"{start:.6f}", "-t", f"{end - start:.6f}"]
+    cmd += ["-i", clip]
+
+    scale = f"fps={fps},scale={width}:-2:flags=lanczos"
+    if preview_format == "gif":
+        cmd += [
+            "-i", palette_file,
+            "-lavfi", f"[0:v]{scale}[x];[x][1:v]paletteuse=dither=bayer:bayer_scale=5:diff_mode=rectangle"
+        ]
+    else:
+        cmd += ["-vf", scale, "-c:v", "libwebp_anim", "-lossless", "0", "-q:v", "75"]
+    cmd += ["-loop", "0", output_file]
+    subprocess.run(cmd, check=True)
+    print(f"Exported {output_file}")
+
+def export_previews(specs, output_dir="previews", preview_format="gif", width=480, fps=15,
+                    jobs=4, quality="720p30", media_dir="media"):
+    """Export every preview spec, generating missing palettes first."""
+    previews = [parse_preview(spec, media_dir, quality) for spec in specs]
+    os.makedirs(output_dir, exist_ok=True)
+
+    palettes = {}
+    if preview_format == "gif":
+        palettes = {clip: get_palette_file(clip, width, media_dir) for _, clip, _, _ in previews}
+
+    extension = PREVIEW_FORMATS[preview_format]
+    outputs = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # Each scene's palette is built once, however many of its ranges are exported
+        missing = [(clip, palette) for clip, palette in palettes.items() if not os.path.exists(palette)]
+        for future in [pool.submit(generate_palette, clip, width, palette) for clip, palette in missing]:
+            future.result()
+
+        futures = []
+        for scene_name, clip, start, end in previews:
+            suffix = "" if start is None else f"_{start:g}-{end:g}"
+            output_file = os.path.join(output_dir, f"{Path(clip).stem}{suffix}{extension}")
+            futures.append(pool.submit(
+                export_preview, clip, start, end, output_file, preview_format, width, fps, palettes.get(clip)
+            ))
+            outputs.append({"path": output_file, "kind": preview_format, "scene": scene_name,
+                            "start": start, "end": end, "width": width, "fps": fps})
+        # Raise the first failure, if any
+        for future in futures:
+            future.result()
+
+    record_outputs(outputs, media_dir)
+
+def main():
+    parser = argparse.ArgumentParser(description="Export looping GIF or WebP previews of scenes")
+    parser.add_argument("previews", nargs="+", help="SCENE, SCENE:START-END or SCENE:play=N")
+    parser.add_argument("--output-dir", "-o", default="previews", help="Directory for the previews")
+    parser.add_argument("--format", "-f", default="gif", choices=sorted(PREVIEW_FORMATS), help="Preview format")
+    parser.add_argument("--width", type=int, default=480, help="Width of the previews in pixels")
+    parser.add_argument("--fps", type=int, default=15, help="Frame rate of the previews")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="Number of previews to export in parallel")
+    parser.add_argument("--quality", "-q", default="720p30",
+                        help="Quality folder to take clips from when a scene is not in the manifest")
+    parser.add_argument("--media-dir", default="media", help="Media directory holding the render manifest")
+
+    args = parser.parse_args()
+
+    try:
+        export_previews(args.previews, args.output_dir, args.format, args.width, args.fps,
+                        args.jobs, args.quality, args.media_dir)
+    except (FileNotFoundError, ValueError, IndexError, subprocess.CalledProcessError) as e:
+        print(f"Error exporting previews: {e}")
+
+if __name__ == "__main__":
+    main()
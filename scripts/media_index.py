@@ -0,0 +1,126 @@
+# scripts/media_index.py
+"""
+Index of the scene clips Manim has rendered into media/videos.
+
+Manim writes clips to videos/<scene file>/<quality>/<clip> and keeps the
+partial movie file of every play under <quality>/partial_movie_files,
+which can hold thousands of files. The index is built with one os.scandir
+pass that never descends into partial movie directories, and is cached in
+the media directory together with the mtime of every directory it read.
+Adding, removing or renaming a clip changes the mtime of its directory,
+so the cache stays valid exactly as long as the tree is unchanged.
+"""
+
+import os
+import json
+
+from encoder_settings import INTERMEDIATE_EXTENSION
+
+INDEX_FILE = "video_index.json"
+PARTIAL_MOVIE_DIR = "partial_movie_files"
+
+# Scene clips are written by Manim as mp4, or as lossless intermediates
+VIDEO_EXTENSIONS = (".mp4", INTERMEDIATE_EXTENSION)
+
+def scan_clips(directory):
+    """Return {clip name: [files]} for the video files directly in a directory."""
+    clips = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name, extension = os.path.splitext(entry.name)
+            if extension in VIDEO_EXTENSIONS and entry.is_file():
+                clips.setdefault(name, []).append(entry.path)
+    return clips
+
+def scan_videos_dir(videos_dir):
+    """
+    Build the scene -> quality -> clip map of a Manim videos directory.
+    Returns the map and the mtime of every directory that was read.
+    """
+    index = {}
+    dir_mtimes = {videos_dir: os.stat(videos_dir).st_mtime_ns}
+    with os.scandir(videos_dir) as scene_entries:
+        for scene_entry in scene_entries:
+            if not scene_entry.is_dir():
+                continue
+            qualities = index[scene_entry.name] = {}
+            dir_mtimes[scene_entry.path] = scene_entry.stat().st_mtime_ns
+            with os.scandir(scene_entry.path) as quality_entries:
+                for quality_entry in quality_entries:
+                    if not quality_entry.is_dir():
+                        continue
+                    # Taken before listing, so a clip written meanwhile invalidates the cache
+                    dir_mtimes[quality_entry.path] = quality_entry.stat().st_mtime_ns
+                    qualities[quality_entry.name] = scan_clips(quality_entry.path)
+    return index, dir_mtimes
+
+def scan_flat_dir(media_dir):
+    """
+    Build the clip map of an output directory that does not follow the
+    Manim layout: every directory below media_dir, except partial movie
+    directories, is searched and listed as a quality of a single scene "".
+    """
+    qualities = {}
+    pending = [media_dir]
+    while pending:
+        directory = pending.pop()
+        clips = scan_clips(directory)
+        if clips:
+            qualities[os.path.relpath(directory, media_dir)] = clips
+        with os.scandir(directory) as entries:
+            pending.extend(
+                entry.path for entry in entries
+                if entry.is_dir() and entry.name != PARTIAL_MOVIE_DIR
+            )
+    return {"": qualities}
+
+def is_index_current(cache, videos_dir):
+    """Return True if no directory read by the cached index has changed."""
+    if cache.get("videos_dir") != videos_dir:
+        return False
+    try:
+        return all(
+            os.stat(directory).st_mtime_ns == mtime
+            for directory, mtime in cache["dir_mtimes"].items()
+        )
+    except OSError:
+        return False
+
+def load_video_index(media_dir):
+    """
+    Return the scene -> quality -> {clip name: [files]} map of media_dir.
+    The map of media_dir/videos is read from the cache when it is current
+    and rebuilt and cached otherwise. Media directories without a videos
+    folder are scanned every time: the cache would be written into the
+    tree it describes and invalidate itself.
+    """
+    videos_dir = os.path.join(media_dir, "videos")
+    if not os.path.isdir(videos_dir):
+        return scan_flat_dir(media_dir)
+
+    index_path = os.path.join(media_dir, INDEX_FILE)
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, 'r') as f:
+                cache = json.load(f)
+            if is_index_current(cache, videos_dir):
+                return cache["scenes"]
+        except (ValueError, KeyError):
+            pass
+
+    index, dir_mtimes = scan_videos_dir(videos_dir)
+    cache = {"videos_dir": videos_dir, "dir_mtimes": dir_mtimes, "scenes": index}
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(temp_path, index_path)
+    return index
+
+def latest_render(files):
+    """
+    A scene rendered both as an mp4 and as a lossless intermediate leaves
+    two clips with the same name; return the most recently written one.
+    """
+    if len(files) == 1:
+        return files[0]
+    return max(files, key=os.path.getmtime)
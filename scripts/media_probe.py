@@ -0,0 +1,90 @@
+# scripts/media_probe.py
+"""
+Helpers for reading metadata from rendered clips with ffprobe.
+Only container headers are read, so these stay cheap on 4K files.
+"""
+
+import subprocess
+
+def probe_duration(video_file):
+    """Return the duration of a video file in seconds."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        video_file
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return float(result.stdout.strip())
+
+def probe_keyframes(video_file):
+    """
+    Return the keyframe timestamps of the first video stream and its
+    decode delay (how far the first packet's pts is ahead of its dts).
+    Only packet headers are read; no frames are decoded.
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,dts_time,flags",
+        "-of", "csv=p=0",
+        video_file
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    
+    keyframes = []
+    decode_delay = None
+    for line in result.stdout.splitlines():
+        pts_time, dts_time, flags = line.split(",")[:3]
+        if pts_time == "N/A":
+            continue
+        if decode_delay is None and dts_time != "N/A":
+            decode_delay = float(pts_time) - float(dts_time)
+        if "K" in flags:
+            keyframes.append(float(pts_time))
+    
+    return sorted(keyframes), decode_delay or 0.0
+
+def probe_frame_rate(video_file):
+    """Return the frame rate of the first video stream in frames per second."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=r_frame_rate",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        video_file
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    numerator, _, denominator = result.stdout.strip().partition("/")
+    return float(numerator) / float(denominator or 1)
+
+def probe_frame_size(video_file):
+    """Return the (width, height) of the first video stream in pixels."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=width,height",
+        "-of", "csv=p=0",
+        video_file
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    width, height = result.stdout.strip().split(",")[:2]
+    return int(width), int(height)
+
+def probe_frame_count(video_file):
+    """Return the number of frames of the first video stream, by counting packets."""
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-count_packets",
+        "-show_entries", "stream=nb_read_packets",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        video_file
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    return int(result.stdout.strip())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# scripts/qa.py
+"""
+Script to check rendered scene clips for the ways a render fails quietly:
+clips cut short, frames stuck on a frozen image, and black segments.
+
+Frames are sampled at keyframes at least --stride seconds apart. Each
+sample seeks straight to its keyframe and decodes only that frame, so a
+clip is never decoded in full; frozen spans can only be located as
+finely as the keyframes allow. Manim clips only have keyframes at the
+start of every play and every 250 frames, so samples can be further
+apart than --stride, and frozen or black spans shorter than the gap can
+be missed; every clip where that happens is reported with the widest
+gap between its samples. Samples from all clips are taken
+concurrently. Frame counts are read from packet headers and compared
+with the render manifest; clips without a manifest entry are reported
+as unchecked. Black spans are only flagged when they lie outside the
+recorded holds and away from the ends of a clip, since Manim scenes
+hold on a black background after a fade.
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from media_index import latest_render, load_video_index
+from media_probe import probe_frame_count, probe_keyframes
+from render_manifest import load_manifest
+from video_sequence import format_time
+
+# Seek a hair past a keyframe so rounding never lands on the one before it
+SEEK_OFFSET = 0.001
+
+# Frames are compared as small grayscale thumbnails
+SAMPLE_SIZE = (64, 36)
+
+# Brightest pixel of a frame that counts as all black (limited-range luma)
+BLACK_LEVEL = 32
+
+# Mean absolute difference below which two samples are the same image
+FREEZE_THRESHOLD = 0.5
+
+# Longest frozen span allowed in clips without a recorded timeline; the
+# longest self.wait() in the scenes is 10 seconds
+UNRECORDED_MAX_FREEZE = 12.0
+
+def get_sample_times(keyframes, stride):
+    """Return the keyframes that are at least stride seconds after the previous sample."""
+    times = []
+    for keyframe in keyframes:
+        if not times or keyframe - times[-1] >= stride - SEEK_OFFSET:
+            times.append(keyframe)
+    return times
+
+def get_widest_gap(times):
+    """Return the longest time between consecutive samples, 0 for fewer than two."""
+    return float(np.max(np.diff(times))) if len(times) > 1 else 0.0
+
+def sample_frame(video_file, time):
+    """
+    Return the keyframe at time as a small grayscale array. Seeking is not
+    accurate and non-keyframes are skipped, so only one frame is decoded.
+    """
+    width, height = SAMPLE_SIZE
+    cmd = [
+        "ffmpeg",
+        "-loglevel", "error",
+        "-noaccurate_seek",
+        "-ss", f"{time + SEEK_OFFSET:.6f}",
+        "-skip_frame", "nokey",
+        "-i", video_file,
+        "-frames:v", "1",
+        "-vf", f"scale={width}:{height},format=gray",
+        "-f", "rawvideo",
+        "-"
+    ]
+    result = subprocess.run(cmd, check=True, capture_output=True)
+    return np.frombuffer(result.stdout, dtype=np.uint8).astype(np.int16)
+
+def find_runs(flags):
+    """Return (first, last) indices of every run of consecutive flagged samples."""
+    runs = []
+    first = None
+    for i, flag in enumerate(flags):
+        if flag and first is None:
+            first = i
+        elif not flag and first is not None:
+            runs.append((first, i - 1))
+            first = None
+    if first is not None:
+        runs.append((first, len(flags) - 1))
+    return runs
+
+def get_holds(entry):
+    """Return the time spans of the static holds recorded for a scene."""
+    if not entry:
+        return []
+    return [(p["start"], p["start"] + p["duration"]) for p in entry.get("plays", []) if p["hold"]]
+
+def uncovered_length(span, holds):
+    """Return how much of a time span lies outside every hold."""
+    start, end = span
+    covered = sum(max(0.0, min(end, hold_end) - max(start, hold_start)) for hold_start, hold_end in holds)
+    return (end - start) - covered
+
+def check_frame_count(video_file, expected):
+    """Return a problem description if the clip has fewer or more frames than expected."""
+    frames = probe_frame_count(video_file)
+    if frames < expected - 1:
+        return f"truncated: {frames} of {expected} frames"
+    if frames > expected + 1:
+        return f"{frames} frames, expected {expected}"
+    return None
+
+def check_samples(times, samples, holds, max_freeze, max_black):
+    """
+    Return problem descriptions for the frozen and black spans of a clip;
+    max_black of 0 turns the black check off.
+    """
+    problems = []
+    if not holds:
+        max_freeze = max(max_freeze, UNRECORDED_MAX_FREEZE)
+
+    # A frozen span runs from the first sample of an image to its last repeat
+    frozen = [False] + [
+        np.abs(samples[i] - samples[i - 1]).mean() < FREEZE_THRESHOLD
+        for i in range(1, len(samples))
+    ]
+    for first, last in find_runs(frozen):
+        span = (times[first - 1], times[last])
+        if uncovered_length(span, holds) > max_freeze:
+            problems.append(f"frozen from {format_time(span[0])} to {format_time(span[1])}")
+
+    if max_black <= 0:
+        return problems
+    black = [sample.max() < BLACK_LEVEL for sample in samples]
+    for first, last in find_runs(black):
+        # Scenes start and end on the empty background
+        if first == 0 or last == len(samples) - 1:
+            continue
+        span = (times[first], times[last])
+        if uncovered_length(span, holds) >= max_black:
+            problems.append(f"black from {format_time(span[0])} to {format_time(span[1])}")
+
+    return problems
+
+def get_clips(media_dir, quality):
+    """Return (clip, manifest entry or None) for every rendered clip of a quality."""
+    entries = {
+        os.path.abspath(entry["file"]): entry
+        for entry in load_manifest(media_dir)["scenes"].values() if "file" in entry
+    }
+    clips = []
+    for qualities in load_video_index(media_dir).values():
+        for files in qualities.get(quality, {}).values():
+            video_file = latest_render(files)
+            clips.append((video_file, entries.get(os.path.abspath(video_file))))
+    return sorted(clips, key=lambda clip: clip[0])
+
+def run_qa(quality="720p30", stride=1.0, max_freeze=3.0, max_black=0.0, jobs=16, media_dir="media"):
+    """Check every clip of a quality and return the number of clips with problems."""
+    clips = get_clips(media_dir, quality)
+    print(f"Checking {len(clips)} {quality} clips, sampling keyframes at least {stride:g} s apart")
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # Only the manifest knows how long a clip should be
+        frame_checks = [
+            pool.submit(check_frame_count, video_file, entry["frames"]) if entry and "frames" in entry else None
+            for video_file, entry in clips
+        ]
+        sample_times = []
+        sample_futures = []
+        for video_file, _ in clips:
+            keyframes, _ = probe_keyframes(video_file)
+            times = get_sample_times(keyframes, stride)
+            sample_times.append(times)
+            sample_futures.append([pool.submit(sample_frame, video_file, t) for t in times])
+
+        failed = 0
+        for (video_file, entry), frame_check, times, futures in zip(
+                clips, frame_checks, sample_times, sample_futures):
+            problems = [problem for problem in [frame_check and frame_check.result()] if problem]
+            samples = [future.result() for future in futures]
+            problems += check_samples(times, samples, get_holds(entry), max_freeze, max_black)
+            if problems:
+                failed += 1
+                print(f"FAIL {video_file}")
+                for problem in problems:
+                    print(f"     {problem}")
+            elif frame_check is None:
+                print(f"ok   {video_file} (frame count unchecked: not in the render manifest)")
+            else:
+                print(f"ok   {video_file}")
+            gap = get_widest_gap(times)
+            if gap > stride + SEEK_OFFSET:
+                print(f"     warning: keyframes are sparser than the stride, samples up to {gap:.1f} s apart; "
+                      f"shorter frozen or black spans can be missed")
+
+    print(f"{failed} of {len(clips)} clips have problems")
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Check rendered clips for black, frozen and truncated video")
+    parser.add_argument("--quality", "-q", default="720p30", help="Video quality folder to check")
+    parser.add_argument("--stride", type=float, default=1.0,
+                        help="Least number of seconds between sampled keyframes; clips whose "
+                             "keyframes are further apart are sampled more coarsely, with a warning")
+    parser.add_argument("--max-freeze", type=float, default=3.0,
+                        help="Longest frozen span allowed outside the recorded holds, in seconds")
+    parser.add_argument("--max-black", type=float, default=0.0,
+                        help="Longest all-black span allowed outside the recorded holds, in seconds "
+                             "(0, the default, turns the check off since the scenes use a black background)")
+    parser.add_argument("--jobs", "-j", type=int, default=16, help="Number of frames to sample in parallel")
+    parser.add_argument("--media-dir", default="media", help="Media directory holding the clips and manifest")
+
+    args = parser.parse_args()
+
+    failed = run_qa(args.quality, args.stride, args.max_freeze, args.max_black, args.jobs, args.media_dir)
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
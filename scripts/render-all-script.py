@@ -6,10 +6,14 @@ Run this script from the project root directory.
 """
 
 import os
+import argparse
 import subprocess
 import sys
 import glob
 
+from render_manifest import record_outputs, record_scene
+from video_sequence import read_sequence
+
 # Quality options:
 # -ql: Low quality, faster rendering
 # -qm: Medium quality
@@ -18,6 +22,25 @@ import glob
 QUALITY = "-qm"  # Default to medium quality
 
 def main():
+    global QUALITY
+    
+    parser = argparse.ArgumentParser(description="Render all animation scenes")
+    for flag in ["-ql", "-qm", "-qh", "-qk"]:
+        parser.add_argument(flag, dest="quality", action="store_const", const=flag)
+    parser.add_argument("--movie", help="Render the sequence in one pass straight into this video file")
+    parser.add_argument("--sequence", "-s", default="video_sequence.txt",
+                        help="File containing the sequence of scenes for movie mode")
+    parser.add_argument("--keyframes", action="store_true",
+                        help="Put an IDR frame at every play and record play start times in the manifest")
+    parser.add_argument("--intermediate", action="store_true",
+                        help="Encode scene clips losslessly (FFV1 in .mov) for a single final encode when combining")
+    
+    args = parser.parse_args()
+    if args.quality:
+        QUALITY = args.quality
+    if args.movie and args.intermediate:
+        parser.error("--intermediate applies to scene clips and cannot be used with --movie")
+    
     print("Starting to render all animations...")
     
     # Get all scene files
@@ -27,36 +50,77 @@ def main():
         print("No scene files found in 'animations/scenes/' directory.")
         return
     
-    # Process command line arguments
-    if len(sys.argv) > 1:
-        global QUALITY
-        if sys.argv[1] in ["-ql", "-qm", "-qh", "-qk"]:
-            QUALITY = sys.argv[1]
+    if args.movie:
+        render_movie_from_sequence(scene_files, args.sequence, args.movie, args.keyframes)
+        return
     
     # Render each scene
     for scene_file in scene_files:
-        render_scenes_in_file(scene_file)
+        render_scenes_in_file(scene_file, args.keyframes or args.intermediate, args.intermediate)
     
     print("All animations rendered successfully!")
 
-def render_scenes_in_file(scene_file):
+def render_movie_from_sequence(scene_files, sequence_file, output_file, keyframes=False):
+    """Render the scenes of a sequence file into one video in a single pass."""
+    # Imported here so the default mode does not load Manim in this process
+    from scene_writers import render_movie
+    
+    # Index every scene class by lower-cased name for case-insensitive matching
+    scene_classes = {}
+    for scene_file in scene_files:
+        module = import_scene_module(scene_file)
+        for scene_class in find_scene_classes(module):
+            scene_classes[scene_class.lower()] = getattr(module, scene_class)
+    
+    sequence = []
+    for scene_name in read_sequence(sequence_file):
+        if scene_name.lower() in scene_classes:
+            sequence.append(scene_classes[scene_name.lower()])
+        else:
+            print(f"Scene {scene_name} from {sequence_file} not found, skipping")
+    
+    try:
+        timeline = render_movie(sequence, output_file, QUALITY, keyframes)
+        print(f"Successfully rendered movie {output_file}")
+    except subprocess.CalledProcessError as e:
+        print(f"Error rendering movie: {e}")
+        return
+    
+    output = {"path": output_file, "kind": "movie"}
+    if timeline:
+        output["scenes"] = [
+            {"scene": scene_name, "start": round(start, 6), "plays": plays}
+            for scene_name, start, plays in timeline
+        ]
+    record_outputs([output])
+
+def import_scene_module(scene_file):
+    """Import a scene file as a module of the animations.scenes package."""
+    module_name = os.path.splitext(os.path.basename(scene_file))[0]
+    sys.path.insert(0, ".")
+    return __import__(f"animations.scenes.{module_name}", fromlist=["*"])
+
+def find_scene_classes(module):
+    """Return the names of the scene classes defined in a module."""
+    scene_classes = []
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if isinstance(attr, type) and attr.__module__ == module.__name__ and attr_name.endswith("Scene"):
+            scene_classes.append(attr_name)
+    return scene_classes
+
+def render_scenes_in_file(scene_file, in_process=False, intermediate=False):
     """Render all scenes in a given file."""
     # Extract filename without extension
     basename = os.path.basename(scene_file)
-    module_name = os.path.splitext(basename)[0]
     
     print(f"Processing file: {basename}")
     
     # Import the module to get scene classes
-    sys.path.insert(0, ".")
-    module = __import__(f"animations.scenes.{module_name}", fromlist=["*"])
+    module = import_scene_module(scene_file)
     
     # Find all scene classes in the module
-    scene_classes = []
-    for attr_name in dir(module):
-        attr = getattr(module, attr_name)
-        if isinstance(attr, type) and attr.__module__ == module.__name__ and attr_name.endswith("Scene"):
-            scene_classes.append(attr_name)
+    scene_classes = find_scene_classes(module)
     
     if not scene_classes:
         print(f"No scene classes found in {basename}")
@@ -64,7 +128,25 @@ def render_scenes_in_file(scene_file):
     
     # Render each scene
     for scene_class in scene_classes:
-        render_scene(scene_file, scene_class)
+        if in_process:
+            render_scene_in_process(scene_file, getattr(module, scene_class), intermediate)
+        else:
+            render_scene(scene_file, scene_class)
+
+def render_scene_in_process(scene_file, scene_class, intermediate=False):
+    """
+    Render a scene in this process and record its clip and the start of
+    every play in the render manifest. Each play starts on a keyframe.
+    """
+    import scene_writers
+    
+    print(f"Rendering scene: {scene_class.__name__}")
+    try:
+        entry = scene_writers.render_scene(scene_file, scene_class, QUALITY, intermediate)
+        record_scene(scene_class.__name__, entry)
+        print(f"Successfully rendered {scene_class.__name__}")
+    except Exception as e:
+        print(f"Error rendering {scene_class.__name__}: {e}")
 
 def render_scene(scene_file, scene_class):
     """Render a specific scene from a file."""
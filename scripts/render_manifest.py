@@ -0,0 +1,57 @@
+# scripts/render_manifest.py
+"""
+Read and write the render manifest: a JSON file in the media directory
+that records the rendered scene clips and the outputs built from them.
+"""
+
+import os
+import json
+import time
+
+MANIFEST_FILE = "render_manifest.json"
+
+def get_manifest_path(media_dir="media"):
+    """Return the path of the manifest inside the media directory."""
+    return os.path.join(media_dir, MANIFEST_FILE)
+
+def load_manifest(media_dir="media"):
+    """Load the manifest, or return an empty one if none has been written."""
+    manifest_path = get_manifest_path(media_dir)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+
+    manifest.setdefault("scenes", {})
+    manifest.setdefault("outputs", [])
+    return manifest
+
+def save_manifest(manifest, media_dir="media"):
+    """Write the manifest atomically so concurrent readers never see a partial file."""
+    manifest_path = get_manifest_path(media_dir)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, manifest_path)
+
+def record_outputs(outputs, media_dir="media"):
+    """
+    Record combined outputs in the manifest.
+    Each output is a dict with at least a "path" key; an existing entry
+    for the same path is replaced.
+    """
+    manifest = load_manifest(media_dir)
+    created = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    paths = {str(output["path"]) for output in outputs}
+    manifest["outputs"] = [o for o in manifest["outputs"] if o["path"] not in paths]
+    for output in outputs:
+        manifest["outputs"].append(dict(output, path=str(output["path"]), created=created))
+
+    save_manifest(manifest, media_dir)
+
+def record_scene(scene_name, entry, media_dir="media"):
+    """Record (or replace) the manifest entry of a rendered scene clip."""
+    manifest = load_manifest(media_dir)
+    manifest["scenes"][scene_name] = dict(entry, rendered=time.strftime("%Y-%m-%dT%H:%M:%S"))
+    save_manifest(manifest, media_dir)
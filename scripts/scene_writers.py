@@ -0,0 +1,304 @@
+# scripts/scene_writers.py
+"""
+Custom Manim file writers used by the render orchestrator.
+
+Manim normally encodes every play() of a scene into its own partial movie
+file and then concatenates them into one mp4 per scene. The writers here
+replace that pipeline when we want frames to go somewhere else.
+"""
+
+import inspect
+import subprocess
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from manim import Camera, config, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import guarantee_existence
+
+from encoder_settings import INTERMEDIATE_CODEC_ARGS, INTERMEDIATE_EXTENSION
+
+# Map the render script's quality flags onto Manim quality names
+QUALITY_NAMES = {
+    "-ql": "low_quality",
+    "-qm": "medium_quality",
+    "-qh": "high_quality",
+    "-qk": "fourk_quality",
+}
+
+class MoviePipe:
+    """
+    A long-lived ffmpeg process that encodes raw frames from many scenes.
+    If keyframe_times is given, an IDR frame is forced at each of those
+    times (in seconds from the start of the movie).
+    """
+
+    def __init__(self, output_file, width, height, frame_rate, keyframe_times=None):
+        force_key_frames = []
+        if keyframe_times:
+            # Half a frame early so rounding never pushes a keyframe late
+            half_frame = 0.5 / frame_rate
+            times = ",".join(f"{max(0.0, t - half_frame):.6f}" for t in keyframe_times)
+            force_key_frames = ["-force_key_frames", times, "-x264-params", "open-gop=0"]
+        if frame_rate == int(frame_rate):
+            frame_rate = int(frame_rate)
+        cmd = [
+            config.ffmpeg_executable,
+            "-y",  # Overwrite output file if it exists
+            "-f", "rawvideo",
+            "-s", f"{width}x{height}",
+            "-pix_fmt", "rgba",
+            "-r", str(frame_rate),
+            "-i", "-",  # Frames come from a pipe
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            "-c:v", "libx264",
+            "-pix_fmt", "yuv420p",
+            *force_key_frames,
+            "-movflags", "+faststart",
+            str(output_file)
+        ]
+        self.output_file = output_file
+        self.frame_count = 0
+        self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def write_frame(self, frame):
+        """Send one RGBA frame to the encoder."""
+        self.process.stdin.write(frame.tobytes())
+        self.frame_count += 1
+
+    def close(self):
+        """Flush the encoder and wait for it to finish the file."""
+        self.process.stdin.close()
+        return self.process.wait()
+
+class MoviePipeFileWriter(SceneFileWriter):
+    """
+    File writer that streams every frame of a scene into a shared MoviePipe
+    instead of writing partial movie files. No files are written per scene.
+    """
+
+    def __init__(self, renderer, scene_name, movie_pipe=None, **kwargs):
+        self.movie_pipe = movie_pipe
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def init_output_directories(self, scene_name):
+        # Nothing is written per scene, so no directories are needed
+        self.output_name = Path(scene_name)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        # The shared pipe stays open across animations and scenes
+        pass
+
+    def end_animation(self, allow_write=False):
+        pass
+
+    def is_already_cached(self, hash_invocation):
+        return False
+
+    def write_frame(self, frame_or_renderer):
+        self.movie_pipe.write_frame(frame_or_renderer)
+
+    def finish(self):
+        # The pipe is closed once by render_movie after the last scene
+        pass
+
+class IntermediateFileWriter(SceneFileWriter):
+    """
+    File writer that encodes partial movie files, and therefore the scene
+    clip joined from them, with the lossless intermediate codec. The lossy
+    encode is left to the combine script.
+    """
+
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        # Keep lossless partial movie files apart from Manim's own cache
+        if hasattr(self, "partial_movie_directory"):
+            self.partial_movie_directory = guarantee_existence(
+                self.partial_movie_directory / "intermediate"
+            )
+
+    def open_movie_pipe(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        frame_rate = config.frame_rate
+        if frame_rate == int(frame_rate):
+            frame_rate = int(frame_rate)
+        cmd = [
+            config.ffmpeg_executable,
+            "-y",  # Overwrite output file if it exists
+            "-f", "rawvideo",
+            "-s", f"{config.pixel_width}x{config.pixel_height}",
+            "-pix_fmt", "rgba",
+            "-r", str(frame_rate),
+            "-i", "-",  # Frames come from a pipe
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            *INTERMEDIATE_CODEC_ARGS,
+            str(file_path)
+        ]
+        self.writing_process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+class PlayRecordingRenderer(CairoRenderer):
+    """
+    Cairo renderer that logs every play() and wait() that ends up in the
+    video: the frame it starts on, its length in frames, and whether it is
+    a hold (a static wait).
+
+    With timeline_only=True nothing is rendered; the log holds the frames a
+    real render would write, which is cheap to compute before encoding.
+    """
+
+    def __init__(self, timeline_only=False, **kwargs):
+        super().__init__(skip_animations=timeline_only, **kwargs)
+        self.timeline_only = timeline_only
+        self.play_log = []
+        self.frame_count = 0
+
+    def play(self, scene, *args, **kwargs):
+        start_time = self.time
+        super().play(scene, *args, **kwargs)
+
+        # Animations skipped without a partial movie file are not in the video
+        if self.animations_hashes[-1] is None and not self.timeline_only:
+            return
+
+        frame_rate = self.camera.frame_rate
+        hold = scene.is_current_animation_frozen_frame()
+        if self.skip_animations:
+            # Nothing was written (timeline only or cached), so count the
+            # frames the same way Scene and CairoRenderer would write them
+            if hold:
+                num_frames = int(scene.duration * frame_rate)
+            else:
+                num_frames = len(np.arange(0, scene.duration, 1 / frame_rate))
+        else:
+            num_frames = round((self.time - start_time) * frame_rate)
+
+        self.play_log.append({
+            "start_frame": self.frame_count,
+            "frames": num_frames,
+            "hold": hold,
+        })
+        self.frame_count += num_frames
+
+    def get_timeline(self):
+        """Return the play log with times in seconds, for the manifest."""
+        frame_rate = self.camera.frame_rate
+        return [
+            {
+                "start": round(play["start_frame"] / frame_rate, 6),
+                "duration": round(play["frames"] / frame_rate, 6),
+                "hold": play["hold"],
+            }
+            for play in self.play_log
+        ]
+
+def get_camera_class(scene_class):
+    """Return the camera class a scene would use by default."""
+    parameter = inspect.signature(scene_class.__init__).parameters.get("camera_class")
+    if parameter is None or parameter.default is inspect.Parameter.empty:
+        return Camera
+    return parameter.default
+
+def render_scene(scene_file, scene_class, quality="-qm", intermediate=False):
+    """
+    Render one scene to its own video, as the Manim CLI would with
+    "-o <scene name>", and return its manifest entry including the start
+    of every play.
+
+    Manim encodes each play into its own partial movie file, which always
+    begins with an IDR frame, and joins them by stream copy; so every play
+    start recorded here is also an IDR frame in the scene's video.
+    With intermediate=True the clip is written losslessly to a .mov file.
+    """
+    scene_name = scene_class.__name__
+    scene_config = {
+        "quality": QUALITY_NAMES[quality],
+        "input_file": scene_file,
+        "output_file": scene_name.lower(),
+    }
+    file_writer_class = SceneFileWriter
+    if intermediate:
+        scene_config["movie_file_extension"] = INTERMEDIATE_EXTENSION
+        file_writer_class = IntermediateFileWriter
+    
+    with tempconfig(scene_config):
+        renderer = PlayRecordingRenderer(
+            file_writer_class=file_writer_class,
+            camera_class=get_camera_class(scene_class)
+        )
+        scene = scene_class(renderer=renderer)
+        scene.render()
+
+        return {
+            "file": str(renderer.file_writer.movie_file_path),
+            "quality": renderer.file_writer.get_resolution_directory(),
+            "codec": "ffv1" if intermediate else "h264",
+            "frame_rate": config.frame_rate,
+            "frames": renderer.frame_count,
+            "duration": round(renderer.frame_count / config.frame_rate, 6),
+            "plays": renderer.get_timeline(),
+        }
+
+def get_movie_timeline(scene_classes):
+    """
+    Run every scene without rendering to find where each scene and play
+    will start in the movie. Returns a list of (scene_name, start, plays).
+    """
+    timeline = []
+    movie_time = 0.0
+    for scene_class in scene_classes:
+        renderer = PlayRecordingRenderer(
+            timeline_only=True,
+            file_writer_class=MoviePipeFileWriter,
+            camera_class=get_camera_class(scene_class)
+        )
+        scene = scene_class(renderer=renderer)
+        scene.render()
+        timeline.append((scene_class.__name__, movie_time, renderer.get_timeline()))
+        movie_time += renderer.frame_count / config.frame_rate
+    return timeline
+
+def render_movie(scene_classes, output_file, quality="-qm", keyframes=False):
+    """
+    Render scenes one after another in this process and encode all their
+    frames into a single video with one ffmpeg encoder.
+    With keyframes=True, a timeline pass runs first so an IDR frame can be
+    forced at the start of every play. Returns that timeline, or None.
+    """
+    # Every frame is encoded straight into the movie, so there is nothing
+    # to reuse from the partial movie cache
+    with tempconfig({"quality": QUALITY_NAMES[quality], "disable_caching": True}):
+        timeline = None
+        keyframe_times = None
+        if keyframes:
+            timeline = get_movie_timeline(scene_classes)
+            keyframe_times = [
+                scene_start + play["start"]
+                for _, scene_start, plays in timeline
+                for play in plays
+            ]
+        movie_pipe = MoviePipe(
+            output_file, config.pixel_width, config.pixel_height, config.frame_rate, keyframe_times
+        )
+        try:
+            for scene_class in scene_classes:
+                print(f"Rendering scene into movie: {scene_class.__name__}")
+                renderer = CairoRenderer(
+                    file_writer_class=partial(MoviePipeFileWriter, movie_pipe=movie_pipe),
+                    camera_class=get_camera_class(scene_class)
+                )
+                scene = scene_class(renderer=renderer)
+                scene.render()
+        finally:
+            return_code = movie_pipe.close()
+
+    if return_code != 0:
+        raise subprocess.CalledProcessError(return_code, "ffmpeg")
+    print(f"Wrote {movie_pipe.frame_count} frames to {output_file}")
+    return timeline
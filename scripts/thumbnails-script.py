@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# scripts/thumbnails.py
+"""
+Script to create a poster frame for every chapter of the combined video,
+a contact sheet of the whole lesson, and a WebVTT thumbnail track for
+the video player's scrubber.
+
+Chapters are read from the render manifest written by the combine script.
+Every image is taken from a keyframe, so ffmpeg only decodes that one
+frame, and the frames are extracted concurrently.
+"""
+
+import os
+import math
+import argparse
+import subprocess
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from media_probe import probe_duration, probe_frame_size, probe_keyframes
+from render_manifest import load_manifest, record_outputs
+
+# Seek a hair past a keyframe so rounding never lands on the one before it
+SEEK_OFFSET = 0.001
+
+# Thumbnails per sprite image of the WebVTT track (columns x columns)
+SPRITE_COLUMNS = 10
+
+def find_output(manifest, video_file=None):
+    """
+    Return the manifest entry of the combined video: the entry for
+    video_file if given, otherwise the newest single-file video.
+    """
+    videos = [o for o in manifest["outputs"] if o["kind"] in ("mp4", "movie")]
+    if video_file:
+        videos = [o for o in videos if os.path.abspath(o["path"]) == os.path.abspath(video_file)]
+    if not videos:
+        raise FileNotFoundError(f"No combined video {video_file or ''} found in the render manifest")
+    return max(videos, key=lambda o: o["created"])
+
+def get_chapters(output):
+    """
+    Return (scene, start, duration) for every chapter of a combined video.
+    Movies rendered in one pass record their scenes without durations;
+    each of those ends where the next one starts.
+    """
+    if "chapters" in output:
+        return [(c["scene"], c["start"], c["duration"]) for c in output["chapters"]]
+
+    scenes = output.get("scenes", [])
+    ends = [scene["start"] for scene in scenes[1:]] + [probe_duration(output["path"])]
+    return [(scene["scene"], scene["start"], end - scene["start"]) for scene, end in zip(scenes, ends)]
+
+def keyframe_at_or_before(keyframes, time):
+    """Return the last keyframe at or before time."""
+    i = bisect_right(keyframes, time + SEEK_OFFSET)
+    return keyframes[max(0, i - 1)]
+
+def get_poster_time(keyframes, start, duration):
+    """
+    Pick the poster frame of a chapter: the keyframe nearest its middle.
+    Scenes tend to open on an empty frame and close with a fade, so the
+    middle is the most representative part.
+    """
+    inside = [k for k in keyframes if start <= k < start + duration] or [start]
+    middle = start + duration / 2
+    return min(inside, key=lambda k: abs(k - middle))
+
+def get_scaled_height(width, video_width, video_height):
+    """Return the even height that keeps the aspect ratio at a given width."""
+    return 2 * round(width * video_height / video_width / 2)
+
+def extract_frame(video_file, time, image_file, width, height):
+    """
+    Save the keyframe at time as a scaled image. Seeking is not
+    accurate and non-keyframes are skipped, so only one frame is decoded.
+    """
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-loglevel", "error",
+        "-noaccurate_seek",
+        "-ss", f"{time + SEEK_OFFSET:.6f}",
+        "-skip_frame", "nokey",
+        "-i", video_file,
+        "-frames:v", "1",
+        "-vf", f"scale={width}:{height}",
+        "-q:v", "3",
+        image_file
+    ]
+    subprocess.run(cmd, check=True)
+
+def tile_images(image_pattern, columns, rows, output_pattern):
+    """Tile numbered images into one or more grids of columns x rows."""
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-loglevel", "error",
+        "-framerate", "1",
+        "-i", image_pattern,
+        "-vf", f"tile={columns}x{rows}",
+        "-start_number", "0",
+        output_pattern
+    ]
+    subprocess.run(cmd, check=True)
+
+def format_timestamp(seconds):
+    """Format seconds as a WebVTT timestamp."""
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(hours):02d}:{int(minutes):02d}:{seconds:06.3f}"
+
+def write_thumbnail_track(vtt_file, cue_times, duration, width, height):
+    """
+    Write a WebVTT track that maps each interval of the video to its
+    thumbnail in the sprite images (sprite_000.jpg, sprite_001.jpg, ...).
+    """
+    per_sprite = SPRITE_COLUMNS * SPRITE_COLUMNS
+    ends = cue_times[1:] + [duration]
+    with open(vtt_file, 'w') as f:
+        f.write("WEBVTT\n")
+        for i, (start, end) in enumerate(zip(cue_times, ends)):
+            position = i % per_sprite
+            x = (position % SPRITE_COLUMNS) * width
+            y = (position // SPRITE_COLUMNS) * height
+            f.write(f"\n{format_timestamp(start)} --> {format_timestamp(end)}\n")
+            f.write(f"sprite_{i // per_sprite:03d}.jpg#xywh={x},{y},{width},{height}\n")
+
+def create_thumbnails(video_file=None, output_dir="thumbnails", interval=5.0, width=320,
+                      poster_width=1280, columns=10, jobs=8, media_dir="media"):
+    """Create the posters, contact sheet and thumbnail track of a combined video."""
+    output = find_output(load_manifest(media_dir), video_file)
+    video_file = output["path"]
+    print(f"Creating thumbnails for {video_file}")
+
+    chapters = get_chapters(output)
+    keyframes, _ = probe_keyframes(video_file)
+    duration = probe_duration(video_file)
+    frame_size = probe_frame_size(video_file)
+
+    thumb_dir = Path(output_dir) / "frames"
+    poster_dir = Path(output_dir) / "posters"
+    thumb_dir.mkdir(parents=True, exist_ok=True)
+    poster_dir.mkdir(parents=True, exist_ok=True)
+
+    # One thumbnail per interval, each showing the keyframe before it
+    cue_times = [i * interval for i in range(math.ceil(duration / interval))]
+    thumb_height = get_scaled_height(width, *frame_size)
+    tasks = [
+        (keyframe_at_or_before(keyframes, t), str(thumb_dir / f"thumb_{i:05d}.jpg"), width, thumb_height)
+        for i, t in enumerate(cue_times)
+    ]
+    posters = []
+    for i, (scene, start, chapter_duration) in enumerate(chapters):
+        poster_file = str(poster_dir / f"{i + 1:02d}_{scene}.jpg")
+        poster_time = get_poster_time(keyframes, start, chapter_duration)
+        tasks.append((poster_time, poster_file, poster_width, get_scaled_height(poster_width, *frame_size)))
+        posters.append({"scene": scene, "path": poster_file, "time": round(poster_time, 6)})
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(extract_frame, video_file, *task) for task in tasks]
+        # Raise the first failure, if any
+        for future in futures:
+            future.result()
+    print(f"Extracted {len(tasks)} frames")
+
+    # The contact sheet holds every thumbnail, the sprites feed the track
+    frame_pattern = str(thumb_dir / "thumb_%05d.jpg")
+    contact_sheet = str(Path(output_dir) / "contact_sheet.jpg")
+    tile_images(frame_pattern, columns, math.ceil(len(cue_times) / columns), contact_sheet)
+    tile_images(frame_pattern, SPRITE_COLUMNS, SPRITE_COLUMNS, str(Path(output_dir) / "sprite_%03d.jpg"))
+
+    vtt_file = str(Path(output_dir) / "thumbnails.vtt")
+    write_thumbnail_track(vtt_file, cue_times, duration, width, thumb_height)
+
+    record_outputs([
+        {"path": vtt_file, "kind": "thumbnails", "video": video_file, "interval": interval},
+        {"path": contact_sheet, "kind": "contact_sheet", "video": video_file},
+        {"path": str(poster_dir), "kind": "posters", "video": video_file, "posters": posters},
+    ], media_dir)
+    print(f"Wrote {contact_sheet}, {vtt_file} and {len(posters)} posters")
+
+def main():
+    parser = argparse.ArgumentParser(description="Create posters, a contact sheet and a thumbnail track")
+    parser.add_argument("--video", "-v", help="Combined video (default: the newest one in the manifest)")
+    parser.add_argument("--output-dir", "-o", default="thumbnails", help="Directory for the images and track")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between scrubber thumbnails")
+    parser.add_argument("--width", type=int, default=320, help="Width of the scrubber thumbnails")
+    parser.add_argument("--poster-width", type=int, default=1280, help="Width of the chapter posters")
+    parser.add_argument("--columns", type=int, default=10, help="Columns of the contact sheet")
+    parser.add_argument("--jobs", "-j", type=int, default=8, help="Number of frames to extract in parallel")
+    parser.add_argument("--media-dir", default="media", help="Media directory holding the render manifest")
+
+    args = parser.parse_args()
+
+    try:
+        create_thumbnails(args.video, args.output_dir, args.interval, args.width,
+                          args.poster_width, args.columns, args.jobs, args.media_dir)
+    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+        print(f"Error creating thumbnails: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# scripts/video_sequence.py
+"""
+Parser for video_sequence.txt, the file that defines the order of scenes
+in the final teaching demonstration.
+
+Each line holds a scene name, optionally followed by in/out trim points:
+
+    BeamCurvatureScene out=-5
+    BeamSlopeScene in=1.5 out=1:02.5
+
+Times are seconds or minutes:seconds. A negative out point is measured
+back from the end of the clip.
+
+A comment line directly above a scene names the section that scene and
+the scenes after it belong to:
+
+    # Mathematical foundation
+    BeamEquationsScene
+"""
+
+from collections import namedtuple
+
+SequenceEntry = namedtuple("SequenceEntry", ["name", "start", "end", "section"], defaults=[None])
+
+def parse_time(value):
+    """Parse a time given as seconds or minutes:seconds."""
+    sign = -1 if value.startswith("-") else 1
+    seconds = 0.0
+    for part in value.lstrip("-").split(":"):
+        seconds = seconds * 60 + float(part)
+    return sign * seconds
+
+def format_time(seconds):
+    """Format seconds as minutes:seconds, the inverse of parse_time."""
+    sign = "-" if seconds < 0 else ""
+    minutes, seconds = divmod(round(abs(seconds), 1), 60)
+    return f"{sign}{int(minutes)}:{seconds:04.1f}"
+
+def parse_entry(line):
+    """Parse one sequence line into a SequenceEntry."""
+    name, *options = line.split()
+    points = {"in": None, "out": None}
+    for option in options:
+        key, separator, value = option.partition("=")
+        if key not in points or not separator:
+            raise ValueError(f"Unknown sequence option '{option}' for {name}")
+        points[key] = parse_time(value)
+    return SequenceEntry(name, points["in"], points["out"])
+
+def read_timeline(sequence_file):
+    """Return the entries of a sequence file, in order."""
+    entries = []
+    section = None
+    comment = None
+    with open(sequence_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#'):
+                comment = line.lstrip('#').strip()
+            elif line:
+                # A comment right above a scene starts a new section
+                if comment is not None:
+                    section = comment
+                    comment = None
+                entries.append(parse_entry(line)._replace(section=section))
+            else:
+                comment = None
+    return entries
+
+def read_sequence(sequence_file):
+    """Return the scene names listed in a sequence file, in order."""
+    return [entry.name for entry in read_timeline(sequence_file)]
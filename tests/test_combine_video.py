@@ -0,0 +1,52 @@
+# tests/test_combine_video.py
+"""Tests of the parallel chunked encode of scripts/combine-video-script.py."""
+
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+sys.path.insert(0, SCRIPTS_DIR)
+combine_video = importlib.import_module("combine-video-script")
+from media_probe import probe_frame_count
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg")
+
+FRAME_RATE = 30
+
+def make_clip(path, duration):
+    """Write a test pattern clip the way Manim encodes scene clips, with a keyframe every 250 frames."""
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc=size=320x240:rate={FRAME_RATE}:duration={duration}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+        str(path)
+    ]
+    subprocess.run(cmd, check=True)
+
+def test_chunked_renditions_match_main_output(tmp_path):
+    durations = [4.0, 3.0]
+    clips = []
+    for i, duration in enumerate(durations):
+        clips.append(tmp_path / f"scene_{i}.mp4")
+        make_clip(clips[-1], duration)
+    list_file = combine_video.create_file_list(
+        [(str(clip), None, None, None) for clip in clips], str(tmp_path / "list.txt")
+    )
+
+    chunk_bounds = combine_video.get_chunk_bounds(durations, 1.5, FRAME_RATE)
+    chunk_files, rendition_chunks = combine_video.encode_in_chunks(
+        list_file, chunk_bounds, str(tmp_path), "draft", [4.0], [120], jobs=2
+    )
+    output_file = str(tmp_path / "out.mp4")
+    combine_video.concat_files(chunk_files, output_file, str(tmp_path / "chunks.txt"))
+    rendition_file = str(tmp_path / "out_120p.mp4")
+    combine_video.concat_files(rendition_chunks[0], rendition_file, str(tmp_path / "renditions.txt"))
+
+    expected = round(sum(durations) * FRAME_RATE)
+    assert probe_frame_count(output_file) == expected
+    assert probe_frame_count(rendition_file) == expected
@@ -0,0 +1,21 @@
+# tests/test_fuel_tank.py
+"""Tests of the fuel surface in animations/utils/fuel_tank.py."""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from animations.utils.fuel_tank import fuel_surface_heights
+
+@pytest.mark.parametrize("tilt", [0.0, 1.0, 2.0])
+def test_fuel_surface_stays_in_tank(tilt):
+    tank_height = 0.72
+    t = np.linspace(-np.pi / 2, np.pi / 2, 500)
+    y_ellipse = (tank_height / 2) * np.cos(t)
+    for phase in np.linspace(0.0, 2 * np.pi, 64):
+        heights = fuel_surface_heights(t, tank_height, phase=phase, tilt=tilt)
+        assert np.all(np.abs(heights) <= y_ellipse + 1e-12)